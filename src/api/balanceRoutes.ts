@@ -7,6 +7,54 @@ import {
   walletBalance
 } from '../controllers/balanceController';
 
+const currencyAmountsSchema = {
+  type: 'object',
+  additionalProperties: { type: 'number' }
+};
+
+/**
+ * 200 response schema for balance endpoints.
+ * Lets Fastify compile a dedicated serializer (fast-json-stringify) for the numeric-heavy
+ * balances payload instead of running the generic JSON.stringify on every response.
+ * Only the hot fields are typed; every object keeps additionalProperties, so anything else
+ * (e.g. certificates) is serialized as-is and the payload matches the schema-less response.
+ */
+const balanceResponseSchema = {
+  200: {
+    type: 'object',
+    additionalProperties: true,
+    properties: {
+      status: { type: 'string' },
+      data: {
+        type: 'object',
+        additionalProperties: true,
+        properties: {
+          message: { type: 'string' },
+          balances: {
+            type: 'array',
+            items: {
+              type: 'object',
+              additionalProperties: true,
+              properties: {
+                network: { type: 'string' },
+                token: { type: 'string' },
+                tokenAddress: { type: 'string' },
+                balance: { type: 'number' },
+                balance_conv: currencyAmountsSchema
+              }
+            }
+          },
+          totals: currencyAmountsSchema,
+          wallets: { type: 'array', items: { type: 'string' } }
+        }
+      },
+      timestamp: { type: 'string' }
+    }
+  }
+};
+
+const balanceRouteOptions = { schema: { response: balanceResponseSchema } };
+
 /**
  * Configures routes related to wallet balances.
  * @param {FastifyInstance} fastify - Fastify instance
@@ -19,7 +67,7 @@ export const balanceRoutes = async (fastify: FastifyInstance): Promise<void> =>
    * @param {string} wallet - The wallet identifier (e.g., wallet address or ID)
    * @returns {Object} The balance of the specified wallet
    */
-  fastify.get('/balance/:wallet', walletBalance);
+  fastify.get('/balance/:wallet', balanceRouteOptions, walletBalance);
 
   /**
    * Route to get the balance associated with a phone number.
@@ -27,7 +75,7 @@ export const balanceRoutes = async (fastify: FastifyInstance): Promise<void> =>
    * @param {string} phoneNumber - The phone number to look up the balance for
    * @returns {Object} The balance linked to the specified phone number
    */
-  fastify.get('/balance_by_phone/', balanceByPhoneNumber);
+  fastify.get('/balance_by_phone/', balanceRouteOptions, balanceByPhoneNumber);
 
   /**
    * Route to get the balance associated with a phone number (sync)
@@ -35,7 +83,7 @@ export const balanceRoutes = async (fastify: FastifyInstance): Promise<void> =>
    * @param {string} phoneNumber - The phone number to look up the balance for
    * @returns {Object} The balance linked to the specified phone number
    */
-  fastify.get('/balance_by_phone_sync/', balanceByPhoneNumberSync);
+  fastify.get('/balance_by_phone_sync/', balanceRouteOptions, balanceByPhoneNumberSync);
 
   /**
    * Route to check external deposits, typically used by Alchemy webhooks to notify of events.
@@ -242,6 +242,10 @@ export const QUEUE_GAS_INTERVAL = Number(queueGasInterval);
 export const QUEUE_CREATE_PROXY_INTERVAL = Number(queueCreateProxyInterval);
 export const MAX_REQUESTS_PER_MINUTE = Number(maxRequestsPerMinute);
 
+export const HTTP_CLIENT_TIMEOUT_MS = 5000;
+export const RPC_PROVIDERS_CACHE_MAX_SIZE = 16;
+export const RPC_BATCH_READ_TIMEOUT_MS = 10000;
+
 export const CACHE_OPENSEA_TTL = 300; // 5 min
 export const CACHE_OPENSEA_CHECK_PERIOD = 600; // 10 min
 
@@ -266,12 +270,23 @@ export const CACHE_ERC20_DATA_CHECK_PERIOD = 518400; // 6 days
 export const CACHE_CHATTERPOINTS_WORDS_TTL = 1728000; // 20 days
 export const CACHE_CHATTERPOINTS_WORDS_CHECK_PERIOD = 1728600; // 20 days + 10 min
 
+export const CACHE_LIFI_CHAINS_TTL = 3600; // 1 hour
+export const CACHE_LIFI_CHAINS_CHECK_PERIOD = 3700; // 62 min
+export const CACHE_FIAT_QUOTES_TTL = 300; // 5 min
+export const CACHE_FIAT_QUOTES_CHECK_PERIOD = 360; // 6 min
+export const CACHE_BINANCE_UNLISTED_TTL = 3600; // 1 hour
+export const CACHE_BINANCE_UNLISTED_CHECK_PERIOD = 3700; // 62 min
+
 // On-Ramp Configuration
 export const ONRAMP_BASE_URL = 'https://onramp.money/main/buy/';
 export const ONRAMP_APP_ID = '1562916';
 export const ONRAMP_DEFAULT_COIN_CODE = 'usdt';
 export const ONRAMP_DEFAULT_NETWORK = 'scroll';
 
+// Multicall3 Configuration (same deterministic address on every supported chain)
+// https://www.multicall3.com/
+export const MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11';
+
 // DefiLlama Configuration
 export const DEFILLAMA_API_URL = 'https://coins.llama.fi/prices/current';
 
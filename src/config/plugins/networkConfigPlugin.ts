@@ -3,7 +3,9 @@ import type { FastifyInstance } from 'fastify';
 import { Logger } from '../../helpers/loggerHelper';
 import type { IBlockchain } from '../../models/blockchainModel';
 import Token, { type IToken } from '../../models/tokenModel';
+import { buildTokensByChain, type ChainTokens } from '../../services/balanceService';
 import { mongoBlockchainService } from '../../services/mongo/mongoBlockchainService';
+import { preloadTokenDecimals } from '../../services/web3/multicallService';
 import {
   FASTIFY_REFRESH_NETWORKS_INTERVAL_MS,
   FASTIFY_REFRESH_TOKENS_INTERVAL_MS
@@ -14,6 +16,10 @@ declare module 'fastify' {
   interface FastifyInstance {
     networkConfig: IBlockchain;
     tokens: IToken[];
+    /** Token lists by chain ID, derived from tokens */
+    tokensByChain: Map<number, ChainTokens>;
+    /** tokens as plain objects, served by GET /tokens */
+    tokensSnapshot: unknown[];
     refreshTokens(): Promise<void>;
     refreshBlockchains(): Promise<void>;
   }
@@ -24,6 +30,24 @@ declare module 'fastify' {
  * @param server - The Fastify server instance.
  */
 export async function setupNetworkConfigPlugin(server: FastifyInstance): Promise<void> {
+  /**
+   * Stores the tokens in the Fastify instance together with everything derived from them,
+   * so the derived data is built once per load and never gets out of sync with tokens.
+   * @param tokens - Tokens fetched from the database
+   */
+  const setTokens = (tokens: IToken[]): void => {
+    // Token decimals never change: preload them so balance reads skip decimals() calls
+    preloadTokenDecimals(tokens);
+    // eslint-disable-next-line no-param-reassign
+    server.tokensByChain = buildTokensByChain(tokens);
+    // eslint-disable-next-line no-param-reassign
+    server.tokensSnapshot = tokens.map((token) =>
+      typeof token.toJSON === 'function' ? token.toJSON() : token
+    );
+    // eslint-disable-next-line no-param-reassign
+    server.tokens = tokens;
+  };
+
   // Fetch the initial tokens from the database when the server starts
   const initialTokens = await Token.find();
 
@@ -33,8 +57,7 @@ export async function setupNetworkConfigPlugin(server: FastifyInstance): Promise
   // Decorate Fastify instance with network configuration and tokens
   // eslint-disable-next-line no-param-reassign
   server.networkConfig = networkConfig;
-  // eslint-disable-next-line no-param-reassign
-  server.tokens = initialTokens;
+  setTokens(initialTokens);
 
   /**
    * Refreshes the tokens stored in the Fastify instance.
@@ -44,8 +67,7 @@ export async function setupNetworkConfigPlugin(server: FastifyInstance): Promise
     try {
       const updatedTokens = await Token.find();
       // Update the tokens in Fastify
-      // eslint-disable-next-line no-param-reassign
-      server.tokens = updatedTokens;
+      setTokens(updatedTokens);
       Logger.info('refreshTokens', 'Tokens refreshed successfully');
     } catch (error) {
       Logger.error('refreshTokens', 'Failed to refresh tokens:', error);
@@ -3,8 +3,6 @@ import { COMMON_REPLY_WALLET_NOT_CREATED } from '../config/constants';
 import { Logger } from '../helpers/loggerHelper';
 import { returnErrorResponse, returnSuccessResponse } from '../helpers/requestHelper';
 import { isValidEthereumWallet, isValidPhoneNumber } from '../helpers/validationHelper';
-import type { IBlockchain } from '../models/blockchainModel';
-import type { IToken } from '../models/tokenModel';
 import type { IUser, IUserWallet } from '../models/userModel';
 import { getAddressBalanceWithNfts } from '../services/balanceService';
 import { fetchExternalDeposits } from '../services/externalDepositsService';
@@ -71,13 +69,10 @@ export const walletBalance = async (
   }
 
   try {
-    const { networkConfig, tokens } = request.server as {
-      networkConfig: IBlockchain;
-      tokens: IToken[];
-    };
+    const { networkConfig, tokensByChain } = request.server;
 
     // phoneNumber and eoaAddress not provided here
-    const data = await getAddressBalanceWithNfts(null, wallet, '', networkConfig, tokens);
+    const data = await getAddressBalanceWithNfts(null, wallet, '', networkConfig, tokensByChain);
 
     return await returnSuccessResponse(reply, 'Wallet balance fetched successfully', data);
   } catch (err) {
@@ -121,10 +116,7 @@ export const balanceByPhoneNumber = async (
       return await returnSuccessResponse(reply, COMMON_REPLY_WALLET_NOT_CREATED);
     }
 
-    const { networkConfig, tokens } = request.server as {
-      networkConfig: IBlockchain;
-      tokens: IToken[];
-    };
+    const { networkConfig, tokensByChain } = request.server;
 
     const { chainId } = networkConfig;
     const userWallet: IUserWallet | null = getUserWalletByChainId(user.wallets, chainId);
@@ -138,7 +130,7 @@ export const balanceByPhoneNumber = async (
       userWallet.wallet_proxy,
       userWallet.wallet_eoa ?? '',
       networkConfig,
-      tokens
+      tokensByChain
     );
 
     return await returnSuccessResponse(reply, 'Wallet balance fetched successfully', data);
@@ -181,10 +173,7 @@ export const balanceByPhoneNumberSync = async (
       return await returnSuccessResponse(reply, COMMON_REPLY_WALLET_NOT_CREATED);
     }
 
-    const { networkConfig, tokens } = request.server as {
-      networkConfig: IBlockchain;
-      tokens: IToken[];
-    };
+    const { networkConfig, tokensByChain } = request.server;
 
     const userWallet: IUserWallet | null = getUserWalletByChainId(
       user.wallets,
@@ -200,7 +189,7 @@ export const balanceByPhoneNumberSync = async (
       userWallet.wallet_proxy,
       userWallet.wallet_eoa,
       networkConfig,
-      tokens
+      tokensByChain
     );
 
     const USD = 'USD' as const satisfies Currency;
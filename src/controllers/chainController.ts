@@ -8,7 +8,11 @@ import type { FastifyReply, FastifyRequest } from 'fastify';
 
 import { Logger } from '../helpers/loggerHelper';
 import { returnErrorResponse, returnSuccessResponse } from '../helpers/requestHelper';
+import { cacheService } from '../services/cache/cacheService';
 import { getLifiChains, type LifiChain } from '../services/lifi';
+import { CacheNames } from '../types/commonType';
+
+const CHAINS_CACHE_KEY = 'chains';
 
 /**
  * GET /chains
@@ -18,19 +22,26 @@ export const getChains = async (request: FastifyRequest, reply: FastifyReply) =>
   const logKey = '[op:get-chains]';
 
   try {
-    Logger.info('getChains', logKey, 'Fetching supported chains from Li.Fi');
-
-    const chains: LifiChain[] = await getLifiChains(logKey);
-
-    // Map to simplified response format
-    const response = chains.map((chain: LifiChain) => ({
-      key: chain.key,
-      name: chain.name.toLowerCase(),
-      chainType: chain.chainType,
-      chainId: chain.id,
-      coin: chain.coin,
-      logoURI: chain.logoURI
-    }));
+    // The supported networks list barely changes: build the response once per cache TTL
+    const response = await cacheService.getOrLoad(
+      CacheNames.LIFI_CHAINS,
+      CHAINS_CACHE_KEY,
+      async () => {
+        Logger.info('getChains', logKey, 'Fetching supported chains from Li.Fi');
+
+        const chains: LifiChain[] = await getLifiChains(logKey);
+
+        // Map to simplified response format
+        return chains.map((chain: LifiChain) => ({
+          key: chain.key,
+          name: chain.name.toLowerCase(),
+          chainType: chain.chainType,
+          chainId: chain.id,
+          coin: chain.coin,
+          logoURI: chain.logoURI
+        }));
+      }
+    );
 
     return returnSuccessResponse(reply, 'Chains fetched successfully', { chains: response });
   } catch (error) {
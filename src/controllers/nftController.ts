@@ -49,6 +49,7 @@ import {
 } from '../services/userService';
 import { getChatterPayNFTABI } from '../services/web3/abiService';
 import { gasService } from '../services/web3/gasService';
+import { getRpcProvider } from '../services/web3/rpc/rpcProviderService';
 import { CacheNames, ConcurrentOperationsEnum } from '../types/commonType';
 
 export interface NFTInfo {
@@ -103,7 +104,7 @@ const mintNftOriginal = async (
 ): Promise<NFTMintData> => {
   try {
     const networkConfig = await mongoBlockchainService.getNetworkConfig(DEFAULT_CHAIN_ID);
-    const provider = new ethers.providers.JsonRpcProvider(networkConfig.rpc);
+    const provider = getRpcProvider(networkConfig.rpc);
     const bs = secService.get_bs(provider);
     const contractABI: ethers.ContractInterface = await getChatterPayNFTABI();
     const nftContract = new ethers.Contract(
@@ -159,7 +160,7 @@ const mintNftCopy = async (
 ): Promise<NFTMintData> => {
   try {
     const networkConfig = await mongoBlockchainService.getNetworkConfig(DEFAULT_CHAIN_ID);
-    const provider = new ethers.providers.JsonRpcProvider(networkConfig.rpc);
+    const provider = getRpcProvider(networkConfig.rpc);
     const bs = secService.get_bs(provider);
     const contractABI: ethers.ContractInterface = await getChatterPayNFTABI();
     const nftContract = new ethers.Contract(
@@ -42,6 +42,7 @@ import {
   openOperation
 } from '../services/userService';
 import { setupERC20 } from '../services/web3/contractSetupService';
+import { getRpcProvider } from '../services/web3/rpc/rpcProviderService';
 import {
   type CheckBalanceConditionsResult,
   ConcurrentOperationsEnum,
@@ -243,7 +244,7 @@ export const swap = async (
     /* ***************************************************** */
     /* 7. swap: check user balance                           */
     /* ***************************************************** */
-    const provider = new ethers.providers.JsonRpcProvider(networkConfig.rpc);
+    const provider = getRpcProvider(networkConfig.rpc);
     const bs = secService.get_bs(provider);
     const proxyAddress = fromUser.wallets[0].wallet_proxy;
 
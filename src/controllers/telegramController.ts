@@ -111,7 +111,8 @@ export const handleTelegramWallet = async (
     // DELEGATE: service decides if we need a phone or we can return the wallet now
     const ctx: ServerCtx = {
       networkConfig: (request.server as unknown as { networkConfig: IBlockchain }).networkConfig,
-      tokens: (request.server as unknown as { tokens: IToken[] }).tokens
+      tokens: (request.server as unknown as { tokens: IToken[] }).tokens,
+      tokensByChain: request.server.tokensByChain
     };
 
     const { reply: out, needsPhone } = await telegramService.handleWalletEntry(
@@ -159,7 +160,8 @@ export const handleTelegramBalance = async (
   try {
     const ctx: ServerCtx = {
       networkConfig: (request.server as unknown as { networkConfig: IBlockchain }).networkConfig,
-      tokens: (request.server as unknown as { tokens: IToken[] }).tokens
+      tokens: (request.server as unknown as { tokens: IToken[] }).tokens,
+      tokensByChain: request.server.tokensByChain
     };
 
     const out = await telegramService.handleBalanceMessage(chatId, text, telegramUserId, ctx);
@@ -305,7 +307,8 @@ export async function handleTelegramUpdate(
     try {
       const ctx: ServerCtx = {
         networkConfig: (request.server as unknown as { networkConfig: IBlockchain }).networkConfig,
-        tokens: (request.server as unknown as { tokens: IToken[] }).tokens
+        tokens: (request.server as unknown as { tokens: IToken[] }).tokens,
+      tokensByChain: request.server.tokensByChain
       };
 
       const result = await telegramService.verifyCodeAndReturnWallet(
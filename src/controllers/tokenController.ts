@@ -66,8 +66,8 @@ export const getAllTokens = async (
   reply: FastifyReply
 ): Promise<FastifyReply> => {
   try {
-    // Use the cached tokens from the Fastify instance.
-    const { tokens } = request.server;
+    // Use the cached tokens from the Fastify instance (pre-serialized once per refresh).
+    const tokens = request.server.tokensSnapshot;
     return await returnSuccessResponse(reply, 'Tokens fetched successfully', { tokens });
   } catch (error) {
     return returnErrorResponse('getAllTokens', '', reply, 400, 'Failed to fetch tokens');
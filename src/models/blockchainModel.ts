@@ -39,6 +39,12 @@ export interface IBlockchain extends Document {
   marketplaceOpenseaUrl: string;
   environment: string;
   supportsEIP1559: boolean;
+  /**
+   * Set to true only if the rpc endpoint accepts JSON-RPC batch requests (arrays of calls).
+   * Balance reads then send their per-token fallback calls (used when Multicall3 fails) as one
+   * batch. Off by default; see .doc/deployment/blockchain-network-settings.md.
+   */
+  supportsRpcBatch?: boolean;
   externalDeposits: ExternalDeposits;
   contracts: {
     entryPoint: string;
@@ -115,6 +121,7 @@ const blockchainSchema = new Schema<IBlockchain>({
   marketplaceOpenseaUrl: { type: String, required: true },
   environment: { type: String, required: true },
   supportsEIP1559: { type: Boolean, required: true },
+  supportsRpcBatch: { type: Boolean, required: false, default: false },
   externalDeposits: { type: externalDepositsSchema, required: true },
   contracts: {
     entryPoint: { type: String, required: false },
@@ -10,6 +10,16 @@ export interface TokenOperationLimits {
   L2: TokenLimitDetail;
 }
 
+/**
+ * Values of IToken.type. A native token (the chain gas coin, e.g. ETH) is stored with a unique
+ * placeholder address; its balance is read with eth_getBalance instead of ERC20 balanceOf.
+ */
+export enum TokenTypeEnum {
+  native = 'native',
+  stable = 'stable',
+  volatile = 'volatile'
+}
+
 export interface IToken extends Document {
   name: string;
   chain_id: number;
@@ -17,7 +27,7 @@ export interface IToken extends Document {
   logo: string;
   address: string;
   symbol: string;
-  type: string;
+  type: string; // TokenTypeEnum
   ramp_enabled: boolean;
   display_decimals: number;
   display_symbol: string;
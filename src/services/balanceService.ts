@@ -1,9 +1,9 @@
 import { ethers } from 'ethers';
-import { BINANCE_API_URL, DEFILLAMA_API_URL } from '../config/constants';
+import { BINANCE_API_URL, DEFILLAMA_API_URL, RPC_BATCH_READ_TIMEOUT_MS } from '../config/constants';
 import { getPhoneNFTs } from '../controllers/nftController';
 import { Logger } from '../helpers/loggerHelper';
 import type { IBlockchain } from '../models/blockchainModel';
-import type { IToken } from '../models/tokenModel';
+import { type IToken, TokenTypeEnum } from '../models/tokenModel';
 import {
   type AddressBalanceWithNfts,
   type BalanceInfo,
@@ -16,12 +16,18 @@ import {
 } from '../types/commonType';
 import { cacheService } from './cache/cacheService';
 import { getFiatQuotes } from './criptoya/criptoYaService';
+import { fetchPriceData } from './http/httpClientService';
 import { secService } from './secService';
-import { getERC20ABI } from './web3/abiService';
+import { erc20ReadInterface } from './web3/abiService';
 import { getDecimalsCache, getTokenBalancesMulticall } from './web3/multicallService';
+import { getRpcBatchProvider, getRpcProvider } from './web3/rpc/rpcProviderService';
 
 const INVALID_TOKEN_ADDRESS_THRESHOLD = ethers.BigNumber.from(1);
 
+function isNativeToken(token: IToken): boolean {
+  return token.type === TokenTypeEnum.native;
+}
+
 function isSkippableTokenContractAddress(address: string): boolean {
   if (!ethers.utils.isAddress(address)) return true;
 
@@ -66,19 +72,20 @@ async function getPricesFromDefiLlama(
 
   try {
     const chainPrefix = getDefiLlamaChainPrefix(chainId);
-    const coins = Array.from(tokenAddresses.entries())
-      .map(([_, address]) => `${chainPrefix}:${address}`)
-      .join(',');
+    // Build the coin keys once: they form the URL and index the response
+    const coinKeys = Array.from(
+      tokenAddresses,
+      ([symbol, address]) => [symbol, `${chainPrefix}:${address}`] as const
+    );
+    const coins = coinKeys.map(([, key]) => key).join(',');
 
     const url = `${DEFILLAMA_API_URL}/${coins}`;
     Logger.log('getPricesFromDefiLlama', `Fetching prices from DefiLlama: ${url}`);
 
-    const res = await fetch(url);
-    const data = await res.json();
+    const data = await fetchPriceData(url);
 
     if (data?.coins) {
-      tokenAddresses.forEach((address, symbol) => {
-        const key = `${chainPrefix}:${address}`;
+      coinKeys.forEach(([symbol, key]) => {
         const coinData = data.coins[key];
         if (coinData?.price) {
           const price = parseFloat(coinData.price);
@@ -95,35 +102,109 @@ async function getPricesFromDefiLlama(
   }
 }
 
+/**
+ * Binance error code for an unknown trading pair
+ */
+const BINANCE_INVALID_SYMBOL_CODE = -1121;
+
+/**
+ * Fetches several Binance ticker prices in a single request
+ * @param {string[]} pairs - Binance pair symbols (e.g. ETHUSDT)
+ * @returns {Promise<Map<string, string> | null>} Map of pair to price, or null if Binance
+ * rejected the batch (e.g. one unknown pair) and callers should query pairs individually
+ */
+async function getBinanceBulkPrices(pairs: string[]): Promise<Map<string, string> | null> {
+  try {
+    const symbolsParam = encodeURIComponent(JSON.stringify(pairs));
+    const data = await fetchPriceData(`${BINANCE_API_URL}/ticker/price?symbols=${symbolsParam}`);
+
+    if (!Array.isArray(data)) {
+      Logger.warn('getBinanceBulkPrices', `Bulk request rejected: ${JSON.stringify(data)}`);
+      return null;
+    }
+
+    return new Map(
+      (data as { symbol: string; price: string }[]).map(({ symbol, price }) => [symbol, price])
+    );
+  } catch (error) {
+    Logger.warn('getBinanceBulkPrices', 'Bulk request failed:', error);
+    return null;
+  }
+}
+
 /**
  * Fetches the balance of a specific token for a given address
  * @param {string} contractAddress - Token contract address
  * @param {ethers.Wallet} signer - Ethereum wallet signer
  * @param {string} address - Address to check balance for
- * @returns {Promise<string>} Token balance as a string
+ * @param {Map<string, number>} cachedDecimals - Known decimals by lowercased token address,
+ * shared with the multicall path; decimals() is only read (and stored) when missing
+ * @returns {Promise<string | null>} Token balance as a string, or null if the call failed
  */
 async function getContractBalance(
   contractAddress: string,
   signer: ethers.Wallet,
-  address: string
-): Promise<string> {
+  address: string,
+  cachedDecimals: Map<string, number>
+): Promise<string | null> {
   try {
-    const ERC20ABI: ethers.ContractInterface = await getERC20ABI();
+    const erc20Contract = new ethers.Contract(contractAddress, erc20ReadInterface, signer);
+    const addressKey = contractAddress.toLowerCase();
+    const knownDecimals = cachedDecimals.get(addressKey);
 
-    const erc20Contract = new ethers.Contract(contractAddress, ERC20ABI, signer);
-
-    const balance = await erc20Contract.balanceOf(address);
-    const decimals = await erc20Contract.decimals();
+    const [balance, decimals] = await Promise.all([
+      erc20Contract.balanceOf(address),
+      knownDecimals ?? erc20Contract.decimals()
+    ]);
+    if (knownDecimals === undefined) cachedDecimals.set(addressKey, decimals);
     return ethers.utils.formatUnits(balance, decimals);
   } catch (error) {
     Logger.error(
       'getContractBalance',
       `Error getting balance: ${error instanceof Error ? error.message : 'Unknown error'}`
     );
-    return '0';
+    return null;
+  }
+}
+
+/**
+ * Fetches the native (ETH) balance for a given address
+ * @param {ethers.providers.Provider} provider - Ethereum provider
+ * @param {string} address - Address to check balance for
+ * @returns {Promise<string | null>} Native balance as a string, or null if the call failed
+ */
+async function getNativeBalance(
+  provider: ethers.providers.Provider,
+  address: string
+): Promise<string | null> {
+  try {
+    const balance = await provider.getBalance(address);
+    return ethers.utils.formatEther(balance);
+  } catch (error) {
+    Logger.error(
+      'getNativeBalance',
+      `Error getting balance: ${error instanceof Error ? error.message : 'Unknown error'}`
+    );
+    return null;
   }
 }
 
+/**
+ * Resolves to null when a balance read does not settle in time.
+ * ethers' JsonRpcBatchProvider leaves calls pending forever when an RPC answers a batch
+ * with a single error object or with fewer items than requested.
+ * @param {Promise<string | null>} read - Balance read
+ * @param {number} timeoutMs - Maximum time to wait, in milliseconds
+ * @returns {Promise<string | null>} The read result, or null on timeout
+ */
+function withReadTimeout(read: Promise<string | null>, timeoutMs: number): Promise<string | null> {
+  let timer: ReturnType<typeof setTimeout> | undefined;
+  const timeout = new Promise<null>((resolve) => {
+    timer = setTimeout(() => resolve(null), timeoutMs);
+  });
+  return Promise.race([read, timeout]).finally(() => clearTimeout(timer));
+}
+
 /**
  * Fetches token prices from Binance API using USDT pairs, with DefiLlama fallback
  * @param {string[]} symbols - Array of token symbols to fetch prices for
@@ -175,31 +256,53 @@ export async function getTokenPrices(
     const wrapToken = (symbol: string): string =>
       symbol.replace(/^ETH$/, 'WETH').replace(/^BTC$/, 'WBTC');
 
-    // Fetch to Binance
-    await Promise.all(
-      symbolsToFetchFromApi.map(async (symbol) => {
-        try {
-          const unwrapped = unwrapToken(symbol);
-          const res = await fetch(`${BINANCE_API_URL}/ticker/price?symbol=${unwrapped}USDT`);
-          const data = await res.json();
-          const wrapped = wrapToken(unwrapped);
-
-          if (data?.price) {
-            const price = parseFloat(data.price);
-            Logger.log('getTokenPrices', `Price for ${symbol}: ${price} USDT`);
-            priceMap.set(wrapped, price);
-            cacheService.set(CacheNames.PRICE, wrapped, price);
-          } else {
-            Logger.warn('getTokenPrices', `No price found for ${unwrapped}USDT`);
-            priceMap.set(wrapped, 0);
-          }
-        } catch (err) {
-          Logger.error('getTokenPrices', `Error fetching price for ${symbol}:`, err);
-          priceMap.set(symbol, 0);
-        }
-      })
+    // ETH/WETH (and BTC/WBTC) share a pair: request each pair once.
+    // Pairs Binance reported as unlisted go straight to the DefiLlama fallback.
+    const pairOf = (symbol: string): string => `${unwrapToken(symbol)}USDT`;
+    const listedPairs = [...new Set(symbolsToFetchFromApi.map(pairOf))].filter(
+      (pair) => !cacheService.has(CacheNames.BINANCE_UNLISTED, pair)
     );
 
+    // Fetch to Binance: one request for all pairs, per-pair requests if the batch is rejected
+    const bulkPrices = listedPairs.length > 1 ? await getBinanceBulkPrices(listedPairs) : null;
+    const pairPrices = bulkPrices ?? new Map<string, string>();
+
+    if (!bulkPrices) {
+      await Promise.all(
+        listedPairs.map(async (pair) => {
+          try {
+            const data = await fetchPriceData(`${BINANCE_API_URL}/ticker/price?symbol=${pair}`);
+            if (data?.price) pairPrices.set(pair, data.price);
+            if (data?.code === BINANCE_INVALID_SYMBOL_CODE) {
+              cacheService.set(CacheNames.BINANCE_UNLISTED, pair, true);
+            }
+          } catch (err) {
+            Logger.error('getTokenPrices', `Error fetching price for ${pair}:`, err);
+          }
+        })
+      );
+    }
+
+    symbolsToFetchFromApi.forEach((symbol) => {
+      const unwrapped = unwrapToken(symbol);
+      const pairPrice = pairPrices.get(pairOf(symbol));
+      const wrapped = wrapToken(unwrapped);
+      // Price both the requested symbol and its wrapped form (e.g. native ETH and WETH)
+      const priceKeys = wrapped === symbol ? [symbol] : [symbol, wrapped];
+
+      if (pairPrice) {
+        const price = parseFloat(pairPrice);
+        Logger.log('getTokenPrices', `Price for ${symbol}: ${price} USDT`);
+        priceKeys.forEach((key) => {
+          priceMap.set(key, price);
+          cacheService.set(CacheNames.PRICE, key, price);
+        });
+      } else {
+        Logger.warn('getTokenPrices', `No price found for ${unwrapped}USDT`);
+        priceKeys.forEach((key) => priceMap.set(key, 0));
+      }
+    });
+
     // DefiLlama fallback for tokens that failed to fetch from Binance
     const failedTokens = new Map<string, string>();
     symbolsToFetchFromApi.forEach((symbol) => {
@@ -232,28 +335,89 @@ export async function getTokenPrices(
 }
 
 /**
- * Gets token information from the global state and current prices
- * @param {IToken[]} tokens - Array of token objects
- * @param {number} chanId - Chain ID to filter tokens
- * @returns {Promise<TokenInfo[]>} Array of tokens with current price information
+ * Token lists of one chain derived from the tokens cached in the Fastify instance
  */
-async function getTokenInfo(tokens: IToken[], chanId: number): Promise<TokenInfo[]> {
+export interface ChainTokens {
+  /** Tokens of the chain, in their original order */
+  tokens: IToken[];
+  /** Addresses of the tokens whose balance and price can be read */
+  readableAddresses: string[];
+  /** Entries of readableAddresses that stand for the chain native token */
+  nativeAddresses: Set<string>;
+  /** Tokens skipped because of an invalid or non-contract address */
+  skippedTokens: IToken[];
+  /** Normalized, unique and sorted symbols of the readable tokens */
+  symbols: string[];
+  /** symbols joined with ',': stable key for price lookups */
+  symbolsKey: string;
+  /** Normalized symbol to contract address (native excluded), used by the DefiLlama fallback */
+  symbolAddresses: Map<string, string>;
+}
+
+/**
+ * Builds the token lists of one chain
+ * @param {IToken[]} chainTokens - Tokens of the chain
+ * @returns {ChainTokens} Token lists of the chain
+ */
+function buildChainTokens(chainTokens: IToken[]): ChainTokens {
   const norm = (s: string) => String(s).trim().toUpperCase();
-  const chainTokens = tokens.filter((token) => token.chain_id === chanId);
-  const priceEligibleTokens = chainTokens.filter(
-    (token) => !isSkippableTokenContractAddress(token.address)
-  );
-  const symbols = [...new Set(priceEligibleTokens.map((token) => norm(token.symbol)))];
+  const isReadable = (token: IToken) =>
+    isNativeToken(token) || !isSkippableTokenContractAddress(token.address);
+  const readableTokens = chainTokens.filter(isReadable);
+  const nativeTokens = readableTokens.filter(isNativeToken);
+  const symbols = [...new Set(readableTokens.map((token) => norm(token.symbol)))].sort();
+  const symbolAddresses = new Map<string, string>();
+  readableTokens.forEach((token) => {
+    if (!isNativeToken(token)) symbolAddresses.set(norm(token.symbol), token.address);
+  });
+
+  return {
+    tokens: chainTokens,
+    readableAddresses: readableTokens.map((token) => token.address),
+    nativeAddresses: new Set(nativeTokens.map((token) => token.address)),
+    skippedTokens: chainTokens.filter((token) => !isReadable(token)),
+    symbols,
+    symbolsKey: symbols.join(','),
+    symbolAddresses
+  };
+}
 
-  // Build address map for DefiLlama fallback
-  const tokenAddresses = new Map<string, string>();
-  priceEligibleTokens.forEach((token) => {
-    tokenAddresses.set(norm(token.symbol), token.address);
+const EMPTY_CHAIN_TOKENS = buildChainTokens([]);
+
+/**
+ * Builds the token lists of every chain found in the given tokens.
+ * networkConfigPlugin calls it each time the server tokens are loaded.
+ * @param {IToken[]} tokens - Array of token objects
+ * @returns {Map<number, ChainTokens>} Token lists by chain ID
+ */
+export function buildTokensByChain(tokens: IToken[]): Map<number, ChainTokens> {
+  const tokensByChainId = new Map<number, IToken[]>();
+  tokens.forEach((token) => {
+    const chainTokens = tokensByChainId.get(token.chain_id);
+    if (chainTokens) chainTokens.push(token);
+    else tokensByChainId.set(token.chain_id, [token]);
   });
 
-  const prices = await getTokenPrices(symbols, tokenAddresses, chanId);
+  return new Map(
+    [...tokensByChainId].map(([chainId, chainTokens]) => [chainId, buildChainTokens(chainTokens)])
+  );
+}
+
+/**
+ * Gets token information from the global state and current prices
+ * @param {ChainTokens} chainTokens - Token lists of the chain
+ * @param {number} chanId - Chain ID of the tokens
+ * @returns {Promise<TokenInfo[]>} Array of tokens with current price information
+ */
+async function getTokenInfo(chainTokens: ChainTokens, chanId: number): Promise<TokenInfo[]> {
+  const norm = (s: string) => String(s).trim().toUpperCase();
+
+  // Concurrent lookups for the same chain/symbols (e.g. proxy + EOA) share one fetch
+  const prices = await cacheService.coalesce(`prices:${chanId}:${chainTokens.symbolsKey}`, () =>
+    getTokenPrices(chainTokens.symbols, chainTokens.symbolAddresses, chanId)
+  );
 
-  return chainTokens.map((token) => ({
+  return chainTokens.tokens.map((token) => ({
     symbol: token.symbol,
     address: token.address,
     type: token.type,
@@ -265,62 +429,92 @@ async function getTokenInfo(tokens: IToken[], chanId: number): Promise<TokenInfo
 }
 
 /**
- * Fetches token balances for a given address using Multicall for efficiency
+ * Fetches token balances for a given address using Multicall for efficiency.
+ * ERC20 balances and the native balance are read in a single aggregate3 call.
  * @param {string} address - Address to check balances for
- * @param {IToken[]} tokens - Array of token objects
+ * @param {Map<number, ChainTokens>} tokensByChain - Token lists by chain ID
  * @param {IBlockchain} networkConfig - Blockchain network configuration
  * @returns {Promise<TokenBalance[]>} Array of token balances
  */
 export async function getTokenBalances(
   address: string,
-  tokens: IToken[],
+  tokensByChain: Map<number, ChainTokens>,
   networkConfig: IBlockchain
 ): Promise<TokenBalance[]> {
-  const provider = new ethers.providers.JsonRpcProvider(networkConfig.rpc);
-  const tokenInfo = await getTokenInfo(tokens, networkConfig.chainId);
-  const validTokenInfo = tokenInfo.filter(
-    (token) => !isSkippableTokenContractAddress(token.address)
-  );
-  const invalidTokenInfo = tokenInfo.filter((token) =>
-    isSkippableTokenContractAddress(token.address)
+  const chainTokens = tokensByChain.get(networkConfig.chainId) ?? EMPTY_CHAIN_TOKENS;
+  // Concurrent requests for the same wallet share a single upstream read
+  return cacheService.coalesce(`balances:${networkConfig.chainId}:${address.toLowerCase()}`, () =>
+    loadTokenBalances(address, chainTokens, networkConfig)
   );
+}
 
-  if (invalidTokenInfo.length > 0) {
+/**
+ * Reads token balances from the chain and joins them with token prices (see getTokenBalances)
+ * @param {string} address - Address to check balances for
+ * @param {ChainTokens} chainTokens - Token lists of the network chain
+ * @param {IBlockchain} networkConfig - Blockchain network configuration
+ * @returns {Promise<TokenBalance[]>} Array of token balances
+ */
+async function loadTokenBalances(
+  address: string,
+  chainTokens: ChainTokens,
+  networkConfig: IBlockchain
+): Promise<TokenBalance[]> {
+  const { readableAddresses, nativeAddresses, skippedTokens } = chainTokens;
+
+  if (skippedTokens.length > 0) {
     Logger.warn(
       'getTokenBalances',
-      `Skipping ${invalidTokenInfo.length} token(s) with invalid/non-contract addresses: ${invalidTokenInfo
+      `Skipping ${skippedTokens.length} token(s) with invalid/non-contract addresses: ${skippedTokens
         .map((token) => `${token.symbol} (${token.address})`)
         .join(', ')}`
     );
   }
 
-  try {
-    const tokenAddresses = validTokenInfo.map((t) => t.address);
+  // Prices don't depend on balances: fetch both at once
+  const [tokenInfo, balanceByAddress] = await Promise.all([
+    getTokenInfo(chainTokens, networkConfig.chainId),
+    readTokenBalances(address, readableAddresses, nativeAddresses, networkConfig)
+  ]);
 
-    if (tokenAddresses.length === 0) {
-      return invalidTokenInfo.map((token) => ({
-        ...token,
-        balance: parseFloat('0').toFixed(token.display_decimals)
-      }));
-    }
+  // Map balances back to original token order (skipped or failed tokens = 0)
+  return tokenInfo.map((token) => {
+    const balance = balanceByAddress.get(token.address) ?? '0';
+    return { ...token, balance: parseFloat(balance).toFixed(token.display_decimals) };
+  });
+}
 
-    // Preload decimals cache from token metadata (if available)
-    const cachedDecimals = getDecimalsCache();
-    validTokenInfo.forEach((token) => {
-      // Try to use decimals from token metadata if available
-      const key = token.address.toLowerCase();
-      if (!cachedDecimals.has(key)) {
-        // We'll let multicall fetch it, but we could also infer from display_decimals
-        // For now, multicall will handle it
-      }
-    });
+/**
+ * Reads raw token balances with a single Multicall3 call, falling back to individual calls
+ * @param {string} address - Address to check balances for
+ * @param {string[]} tokenAddresses - Token contract addresses
+ * @param {ReadonlySet<string>} nativeAddresses - Entries of tokenAddresses that are native tokens
+ * @param {IBlockchain} networkConfig - Blockchain network configuration
+ * @returns {Promise<Map<string, string>>} Map of token address (as given) to formatted balance.
+ * Tokens whose balance could not be read are not included.
+ */
+async function readTokenBalances(
+  address: string,
+  tokenAddresses: string[],
+  nativeAddresses: ReadonlySet<string>,
+  networkConfig: IBlockchain
+): Promise<Map<string, string>> {
+  const balances = new Map<string, string>();
+  if (tokenAddresses.length === 0) return balances;
 
+  const provider = getRpcProvider(networkConfig.rpc);
+  // Decimals are preloaded from token metadata (see networkConfigPlugin);
+  // both read paths only fetch the ones still missing
+  const cachedDecimals = getDecimalsCache();
+
+  try {
     const startTime = Date.now();
     const multicallResults = await getTokenBalancesMulticall(
       provider,
       address,
       tokenAddresses,
-      cachedDecimals
+      cachedDecimals,
+      nativeAddresses
     );
     const elapsed = Date.now() - startTime;
 
@@ -329,50 +523,60 @@ export async function getTokenBalances(
       `Multicall completed in ${elapsed}ms for ${tokenAddresses.length} tokens`
     );
 
-    const resultByAddress = new Map(
-      multicallResults.map((result) => [result.tokenAddress.toLowerCase(), result])
-    );
-
-    // Map multicall results back to original token order
-    return tokenInfo.map((token) => {
-      if (isSkippableTokenContractAddress(token.address)) {
-        return {
-          ...token,
-          balance: parseFloat('0').toFixed(token.display_decimals)
-        };
-      }
-
-      const result = resultByAddress.get(token.address.toLowerCase());
-      if (!result || !result.success) {
+    multicallResults.forEach((result) => {
+      if (!result.success) {
         Logger.warn(
           'getTokenBalances',
-          `Failed to get balance for ${token.symbol} (${token.address}): ${result?.error || 'Unknown error'}`
+          `Failed to get balance for ${result.tokenAddress}: ${result.error || 'Unknown error'}`
         );
-        return {
-          ...token,
-          balance: parseFloat('0').toFixed(token.display_decimals)
-        };
+        return;
       }
-
-      const formattedBalance = parseFloat(result.balance).toFixed(token.display_decimals);
-      return { ...token, balance: formattedBalance };
+      balances.set(result.tokenAddress, result.balance);
     });
+
+    return balances;
   } catch (error) {
-    // Fallback to individual calls if multicall fails
-    Logger.error('getTokenBalances', 'Multicall failed, falling back to individual calls:', error);
+    // Fallback to individual calls if multicall fails (e.g. Multicall3 not deployed).
+    // Networks flagged with supportsRpcBatch send the individual calls as one JSON-RPC batch.
+    const useRpcBatch = networkConfig.supportsRpcBatch === true;
+    Logger.error(
+      'getTokenBalances',
+      `Multicall failed, falling back to individual calls (rpc batch: ${useRpcBatch}):`,
+      error
+    );
+
+    const readBalance = (
+      tokenAddress: string,
+      readProvider: ethers.providers.JsonRpcProvider,
+      bs: ethers.Wallet
+    ): Promise<string | null> =>
+      nativeAddresses.has(tokenAddress)
+        ? getNativeBalance(readProvider, address)
+        : getContractBalance(tokenAddress, bs, address, cachedDecimals);
 
     const bs = secService.get_bs(provider);
-    return Promise.all(
-      tokenInfo.map(async (token) => {
-        if (isSkippableTokenContractAddress(token.address)) {
-          return { ...token, balance: parseFloat('0').toFixed(token.display_decimals) };
+    const batchProvider = useRpcBatch ? getRpcBatchProvider(networkConfig.rpc) : null;
+    const batchBs = batchProvider ? secService.get_bs(batchProvider) : bs;
+
+    await Promise.all(
+      tokenAddresses.map(async (tokenAddress) => {
+        let rawBalance = batchProvider
+          ? await withReadTimeout(
+              readBalance(tokenAddress, batchProvider, batchBs),
+              RPC_BATCH_READ_TIMEOUT_MS
+            )
+          : await readBalance(tokenAddress, provider, bs);
+
+        // Failed or stalled batch: retry this token with a plain per-call request
+        if (rawBalance === null && batchProvider) {
+          rawBalance = await readBalance(tokenAddress, provider, bs);
         }
 
-        const rawBalance = await getContractBalance(token.address, bs, address);
-        const formattedBalance = parseFloat(rawBalance).toFixed(token.display_decimals);
-        return { ...token, balance: formattedBalance };
+        if (rawBalance !== null) balances.set(tokenAddress, rawBalance);
       })
     );
+
+    return balances;
   }
 }
 
@@ -388,6 +592,13 @@ export function calculateBalances(
   fiatQuotes: FiatQuote[],
   networkName: string
 ): BalanceInfo[] {
+  // Resolve fiat rates once, instead of searching the quotes for every token and currency
+  const rateOf = (currency: Currency): number =>
+    fiatQuotes.find((q) => q.currency === currency)?.rate ?? 1;
+  const rateUYU = rateOf('UYU');
+  const rateARS = rateOf('ARS');
+  const rateBRL = rateOf('BRL');
+
   return tokenBalances.map(({ symbol, address, balance, rateUSD, display_decimals }) => {
     // Cast once for math
     const balanceNum = parseFloat(balance);
@@ -405,9 +616,9 @@ export function calculateBalances(
       balance: roundedBalance,
       balance_conv: {
         USD: balanceUSD,
-        UYU: balanceUSD * (fiatQuotes.find((q) => q.currency === 'UYU')?.rate ?? 1),
-        ARS: balanceUSD * (fiatQuotes.find((q) => q.currency === 'ARS')?.rate ?? 1),
-        BRL: balanceUSD * (fiatQuotes.find((q) => q.currency === 'BRL')?.rate ?? 1)
+        UYU: balanceUSD * rateUYU,
+        ARS: balanceUSD * rateARS,
+        BRL: balanceUSD * rateBRL
       }
     };
   });
@@ -419,15 +630,18 @@ export function calculateBalances(
  * @returns {Record<Currency, number>} Record of currency totals
  */
 export function calculateBalancesTotals(balances: BalanceInfo[]): Record<Currency, number> {
-  return balances.reduce(
-    (acc, balance) => {
-      (Object.keys(balance.balance_conv) as Currency[]).forEach((currency) => {
-        acc[currency] = (acc[currency] || 0) + balance.balance_conv[currency];
-      });
-      return acc;
-    },
-    {} as Record<Currency, number>
-  );
+  if (balances.length === 0) return {} as Record<Currency, number>;
+
+  // Single pass over fixed fields (balance_conv always holds every currency, see
+  // calculateBalances) instead of building a keys array per balance
+  const totals: Record<Currency, number> = { USD: 0, UYU: 0, ARS: 0, BRL: 0 };
+  balances.forEach(({ balance_conv: conv }) => {
+    totals.USD += conv.USD;
+    totals.UYU += conv.UYU;
+    totals.ARS += conv.ARS;
+    totals.BRL += conv.BRL;
+  });
+  return totals;
 }
 
 /**
@@ -472,14 +686,17 @@ export async function verifyWalletBalance(
   walletAddress: string,
   amountToCheck: string
 ): Promise<WalletBalanceInfo> {
-  const symbol: string = await tokenContract.symbol();
-  const decimals = await tokenContract.decimals();
+  // Independent reads: issue them concurrently instead of one RPC round trip after another
+  const [symbol, decimals, walletBalance]: [string, number, ethers.BigNumber] = await Promise.all([
+    tokenContract.symbol(),
+    tokenContract.decimals(),
+    tokenContract.balanceOf(walletAddress)
+  ]);
 
   Logger.log(
     'verifyWalletBalance',
     `Checking balance for ${walletAddress} and token ${tokenContract.address}, to spend: ${amountToCheck} ${symbol}`
   );
-  const walletBalance = await tokenContract.balanceOf(walletAddress);
   const amountToCheckFormatted = ethers.utils.parseUnits(amountToCheck, decimals);
   const walletBalanceFormatted = ethers.utils.formatEther(walletBalance);
 
@@ -511,11 +728,8 @@ export async function verifyWalletBalanceInRpc(
   walletAddress: string,
   amountToCheck: string
 ): Promise<WalletBalanceInfo> {
-  const provider = new ethers.providers.JsonRpcProvider(rpcUrl);
-
-  const ERC20ABI = await getERC20ABI();
-
-  const tokenContract = new ethers.Contract(tokenAddress, ERC20ABI, provider);
+  const provider = getRpcProvider(rpcUrl);
+  const tokenContract = new ethers.Contract(tokenAddress, erc20ReadInterface, provider);
 
   return verifyWalletBalance(tokenContract, walletAddress, amountToCheck);
 }
@@ -527,7 +741,7 @@ export async function verifyWalletBalanceInRpc(
  * @param eoaAddress - Externally Owned Account address
  * @param reply - Fastify reply object
  * @param networkConfig - Fastify blockchain network configuration
- * @param tokens - Token metadata list for the target network
+ * @param tokensByChain - Token lists by chain ID (see buildTokensByChain)
  * @returns Plain data object with balances, totals, certificates and wallets
  */
 
@@ -536,7 +750,7 @@ export async function getAddressBalanceWithNfts(
   proxyAddress: string,
   eoaAddress: string,
   networkConfig: IBlockchain,
-  tokens: IToken[]
+  tokensByChain: Map<number, ChainTokens>
 ): Promise<AddressBalanceWithNfts> {
   const eoaProvided =
     !!eoaAddress &&
@@ -551,8 +765,10 @@ export async function getAddressBalanceWithNfts(
   try {
     const [fiatQuotes, proxyTokenBalances, eoaTokenBalances, NFTs] = await Promise.all([
       getFiatQuotes(),
-      getTokenBalances(proxyAddress, tokens, networkConfig),
-      eoaProvided ? getTokenBalances(eoaAddress, tokens, networkConfig) : Promise.resolve([]),
+      getTokenBalances(proxyAddress, tokensByChain, networkConfig),
+      eoaProvided
+        ? getTokenBalances(eoaAddress, tokensByChain, networkConfig)
+        : Promise.resolve([]),
       phoneNumber ? getPhoneNFTs(phoneNumber) : Promise.resolve({ nfts: [] })
     ]);
 
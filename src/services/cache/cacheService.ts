@@ -3,12 +3,18 @@ import NodeCache from 'node-cache';
 import {
   CACHE_ABI_CHECK_PERIOD,
   CACHE_ABI_TTL,
+  CACHE_BINANCE_UNLISTED_CHECK_PERIOD,
+  CACHE_BINANCE_UNLISTED_TTL,
   CACHE_CHATTERPOINTS_WORDS_CHECK_PERIOD,
   CACHE_CHATTERPOINTS_WORDS_TTL,
   CACHE_COINGECKO_CHECK_PERIOD,
   CACHE_COINGECKO_TTL,
   CACHE_ERC20_DATA_CHECK_PERIOD,
   CACHE_ERC20_DATA_TTL,
+  CACHE_FIAT_QUOTES_CHECK_PERIOD,
+  CACHE_FIAT_QUOTES_TTL,
+  CACHE_LIFI_CHAINS_CHECK_PERIOD,
+  CACHE_LIFI_CHAINS_TTL,
   CACHE_NOTIFICATION_CHECK_PERIOD,
   CACHE_NOTIFICATION_TTL,
   CACHE_OPENSEA_CHECK_PERIOD,
@@ -40,6 +46,18 @@ const TTL_CONFIG = {
   [CacheNames.CHATTERPOINTS_WORDS]: {
     stdTTL: CACHE_CHATTERPOINTS_WORDS_TTL,
     checkperiod: CACHE_CHATTERPOINTS_WORDS_CHECK_PERIOD
+  },
+  [CacheNames.LIFI_CHAINS]: {
+    stdTTL: CACHE_LIFI_CHAINS_TTL,
+    checkperiod: CACHE_LIFI_CHAINS_CHECK_PERIOD
+  },
+  [CacheNames.FIAT_QUOTES]: {
+    stdTTL: CACHE_FIAT_QUOTES_TTL,
+    checkperiod: CACHE_FIAT_QUOTES_CHECK_PERIOD
+  },
+  [CacheNames.BINANCE_UNLISTED]: {
+    stdTTL: CACHE_BINANCE_UNLISTED_TTL,
+    checkperiod: CACHE_BINANCE_UNLISTED_CHECK_PERIOD
   }
 };
 
@@ -51,7 +69,10 @@ const caches: Record<CacheNames, NodeCache> = {
   [CacheNames.TOR]: new NodeCache(TTL_CONFIG[CacheNames.TOR]),
   [CacheNames.COINGECKO]: new NodeCache(TTL_CONFIG[CacheNames.COINGECKO]),
   [CacheNames.ERC20]: new NodeCache(TTL_CONFIG[CacheNames.ERC20]),
-  [CacheNames.CHATTERPOINTS_WORDS]: new NodeCache(TTL_CONFIG[CacheNames.CHATTERPOINTS_WORDS])
+  [CacheNames.CHATTERPOINTS_WORDS]: new NodeCache(TTL_CONFIG[CacheNames.CHATTERPOINTS_WORDS]),
+  [CacheNames.LIFI_CHAINS]: new NodeCache(TTL_CONFIG[CacheNames.LIFI_CHAINS]),
+  [CacheNames.FIAT_QUOTES]: new NodeCache(TTL_CONFIG[CacheNames.FIAT_QUOTES]),
+  [CacheNames.BINANCE_UNLISTED]: new NodeCache(TTL_CONFIG[CacheNames.BINANCE_UNLISTED])
 };
 
 // De-duplication of concurrent loads (global, cross-cache)
@@ -190,6 +211,31 @@ export const cacheService = {
       }
     })();
 
+    inflightGlobal.set(ikey, p);
+    return p;
+  },
+
+  /**
+   * Coalesce concurrent loads for the same key into a single in-flight Promise.
+   * Unlike getOrLoad, the result is NOT cached: once the load settles, the next call
+   * loads again. Use it for data that must never be served stale (e.g. balances).
+   */
+  coalesce<T>(key: string, loader: () => Promise<T>): Promise<T> {
+    const ikey = `coalesce:${key}`;
+    const existing = inflightGlobal.get(ikey) as Promise<T> | undefined;
+    if (existing) {
+      Logger.log('cacheService:coalesce', `INFLIGHT HIT key=${key}`);
+      return existing;
+    }
+
+    const p = (async () => {
+      try {
+        return await loader();
+      } finally {
+        inflightGlobal.delete(ikey);
+      }
+    })();
+
     inflightGlobal.set(ikey, p);
     return p;
   }
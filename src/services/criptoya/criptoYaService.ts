@@ -1,9 +1,12 @@
 import { CRIPTO_YA_URL, FIAT_CURRENCIES } from '../../config/constants';
 import { Logger } from '../../helpers/loggerHelper';
-import type { Currency, FiatQuote } from '../../types/commonType';
+import { CacheNames, type Currency, type FiatQuote } from '../../types/commonType';
+import { cacheService } from '../cache/cacheService';
+import { fetchPriceData } from '../http/httpClientService';
 
 /**
- * Fetches fiat quotes from external APIs
+ * Fetches fiat quotes from external APIs.
+ * Quotes are cached per currency (see CACHE_FIAT_QUOTES_TTL); failed lookups are not cached.
  * @returns {Promise<FiatQuote[]>} Array of fiat currency quotes
  */
 export async function getFiatQuotes(): Promise<FiatQuote[]> {
@@ -11,9 +14,13 @@ export async function getFiatQuotes(): Promise<FiatQuote[]> {
     (FIAT_CURRENCIES as Currency[]).map(async (currency) => {
       const url = `${CRIPTO_YA_URL}/${currency}`;
       try {
-        const response = await fetch(url);
-        const data = await response.json();
-        return { currency, rate: Number(data.bid) } as FiatQuote;
+        const rate = await cacheService.getOrLoad(CacheNames.FIAT_QUOTES, currency, async () => {
+          const data = await fetchPriceData(url);
+          const bid = Number(data?.bid);
+          if (!Number.isFinite(bid)) throw new Error(`Invalid ${currency} quote: ${data?.bid}`);
+          return bid;
+        });
+        return { currency, rate } as FiatQuote;
       } catch (error) {
         Logger.error('getFiatQuotes', `Error fetching ${currency} quote:`, error);
         return { currency, rate: 1 }; // Fallback to 1:1 rate
@@ -0,0 +1,17 @@
+import { HTTP_CLIENT_TIMEOUT_MS } from '../../config/constants';
+
+/**
+ * Fetches a JSON document from a price or fiat quote provider (Binance, DefiLlama, CriptoYa).
+ * Every price lookup (balances, fiat quotes, swap pricing) goes through here.
+ *
+ * fetch already reuses keep-alive connections; this only bounds how long a provider may
+ * take, so a stalled lookup cannot hold a request. Non-2xx bodies are returned as-is
+ * so callers can inspect provider errors (e.g. Binance error codes).
+ *
+ * @param {string} url - Provider URL
+ * @returns {Promise<any>} Parsed JSON body
+ */
+export async function fetchPriceData(url: string): Promise<any> {
+  const response = await fetch(url, { signal: AbortSignal.timeout(HTTP_CLIENT_TIMEOUT_MS) });
+  return response.json();
+}
@@ -13,7 +13,7 @@ import {
 } from '../config/constants';
 import { Logger } from '../helpers/loggerHelper';
 import type { IBlockchain } from '../models/blockchainModel';
-import type { IToken } from '../models/tokenModel';
+import { type IToken, TokenTypeEnum } from '../models/tokenModel';
 import type {
   ExecueTransactionResult,
   ExecuteSwapResult,
@@ -22,6 +22,7 @@ import type {
 } from '../types/commonType';
 import { getTokenInfo } from './blockchainService';
 import { getTokenDecimals, getTokenSymbol } from './commonService';
+import { fetchPriceData } from './http/httpClientService';
 import type { LifiQuoteResponse } from './lifi';
 import { getLifiQuote, parseLifiError, validateLifiQuote } from './lifi';
 import {
@@ -351,14 +352,13 @@ async function getBinancePrice(symbol: string, logKey: string): Promise<number |
     const url = `${BINANCE_API_URL}/ticker/price?symbol=${symbol}USD`;
     Logger.debug('getBinancePrice', logKey, `Making request to: ${url}`);
 
-    const response = await fetch(url);
-    if (!response.ok) {
+    const data = await fetchPriceData(url);
+    Logger.debug('getBinancePrice', logKey, `Binance response: ${JSON.stringify(data)}`);
+    // Unknown pairs and other Binance errors answer { code, msg } without a price
+    if (data?.price === undefined) {
       Logger.info('getBinancePrice', logKey, `No Binance price available for ${symbol}`);
       return null;
     }
-
-    const data = await response.json();
-    Logger.debug('getBinancePrice', logKey, `Binance response: ${JSON.stringify(data)}`);
     Logger.info('getBinancePrice', logKey, `Current price for ${symbol}: ${data.price}`);
 
     return parseFloat(data.price);
@@ -929,21 +929,28 @@ async function fetchTokenPrices(
   provider: ethers.providers.Provider,
   logKey: string
 ) {
-  const [tokenInFeed, tokenOutFeed] = await Promise.all([
-    chatterPayContract.getPriceFeed(tokenIn),
-    chatterPayContract.getPriceFeed(tokenOut)
-  ]);
+  // Chainlink (feed lookup + round data) and Binance are independent sources:
+  // fetch them concurrently so total latency is max(sources) instead of the sum.
+  const chainlinkPrices = (async () => {
+    const [tokenInFeed, tokenOutFeed] = await Promise.all([
+      chatterPayContract.getPriceFeed(tokenIn),
+      chatterPayContract.getPriceFeed(tokenOut)
+    ]);
 
-  const [chainlinkPriceIn, chainlinkPriceOut] = await Promise.all([
-    getChainlinkPrice(tokenInFeed, priceFeedABI, provider, logKey),
-    getChainlinkPrice(tokenOutFeed, priceFeedABI, provider, logKey)
-  ]);
+    return Promise.all([
+      getChainlinkPrice(tokenInFeed, priceFeedABI, provider, logKey),
+      getChainlinkPrice(tokenOutFeed, priceFeedABI, provider, logKey)
+    ]);
+  })();
 
-  const [binancePriceIn, binancePriceOut] = await Promise.all([
+  const binancePrices = Promise.all([
     getBinancePrice(tokenInSymbol, logKey),
     getBinancePrice(tokenOutSymbol, logKey)
   ]);
 
+  const [[chainlinkPriceIn, chainlinkPriceOut], [binancePriceIn, binancePriceOut]] =
+    await Promise.all([chainlinkPrices, binancePrices]);
+
   // Use the lower price for output token for safety
   const effectivePriceOut = !binancePriceOut
     ? chainlinkPriceOut
@@ -1493,7 +1500,7 @@ export async function validateSwap(
 
     // 4) Slippage policy (idéntica a executeSwap)
     const tokenInfoOut = getTokenInfo(networkConfig, blockchainTokens, tokenOut);
-    const isOutStable = tokenInfoOut?.type === 'stable';
+    const isOutStable = tokenInfoOut?.type === TokenTypeEnum.stable;
     const baseSlippage = await determineSlippage(
       chatterPayContract,
       tokenDetails.tokenOutSymbol,
@@ -10,7 +10,7 @@ import type { IBlockchain } from '../../models/blockchainModel';
 import type { IToken } from '../../models/tokenModel';
 import type { IUser, IUserWallet } from '../../models/userModel';
 import type { BalanceInfo, Currency } from '../../types/commonType';
-import { getAddressBalanceWithNfts } from '../balanceService';
+import { type ChainTokens, getAddressBalanceWithNfts } from '../balanceService';
 import { chatizaloService } from '../chatizalo/chatizaloService';
 import {
   clearUserVerificationCode,
@@ -36,6 +36,7 @@ export type TelegramReplyPayload = {
 export type ServerCtx = {
   networkConfig: IBlockchain;
   tokens: IToken[];
+  tokensByChain: Map<number, ChainTokens>;
 };
 
 /** 6-digit validator. */
@@ -393,7 +394,7 @@ export const telegramService = {
       };
     }
 
-    const { networkConfig, tokens } = ctx;
+    const { networkConfig, tokensByChain } = ctx;
     const userWallet = getUserWalletByChainId(
       user.wallets,
       networkConfig.chainId
@@ -412,7 +413,7 @@ export const telegramService = {
       userWallet.wallet_proxy,
       userWallet.wallet_eoa,
       networkConfig,
-      tokens
+      tokensByChain
     );
 
     const USD = 'USD' as const satisfies Currency;
@@ -7,6 +7,7 @@ import { mongoReferralService } from './mongo/mongoReferralService';
 import { mongoUserService } from './mongo/mongoUserService';
 import { secService } from './secService';
 import { addWalletToUser, createUserWithWallet, getUserWalletByChainId } from './userService';
+import { getRpcProvider } from './web3/rpc/rpcProviderService';
 import { wrapRpc } from './web3/rpc/rpcService';
 
 /**
@@ -67,9 +68,7 @@ export async function issueTokens(
 ): Promise<MintResult[]> {
   const amount: string = '10000';
 
-  const provider: ethers.providers.JsonRpcProvider = new ethers.providers.JsonRpcProvider(
-    networkConfig.rpc
-  );
+  const provider = getRpcProvider(networkConfig.rpc);
   const bs = secService.get_bs(provider);
 
   // Filter tokens for the current chain
@@ -1,4 +1,4 @@
-import type { ethers } from 'ethers';
+import { ethers } from 'ethers';
 import * as fs from 'fs-extra';
 import path from 'path';
 import { ABIS_READ_FROM, GCP_ABIs, LOCAL_ABIs } from '../../config/constants';
@@ -9,6 +9,17 @@ import { getGcpFile } from '../gcp/gcpService';
 
 export type ABI = ethers.ContractInterface;
 
+/**
+ * Minimal ERC20 read-only ABI (balanceOf/decimals/symbol).
+ * Parsed once into a shared Interface: building contracts from it skips walking
+ * the full ERC20 ABI on every read.
+ */
+export const erc20ReadInterface = new ethers.utils.Interface([
+  'function balanceOf(address account) view returns (uint256)',
+  'function decimals() view returns (uint8)',
+  'function symbol() view returns (string)'
+]);
+
 const abisReadFromLocal = ABIS_READ_FROM === 'local';
 
 /**
@@ -5,6 +5,7 @@ import type { ComputedAddress, SetupContractReturn } from '../../types/commonTyp
 import { mongoBlockchainService } from '../mongo/mongoBlockchainService';
 import { secService } from '../secService';
 import { getChatterpayABI, getERC20ABI } from './abiService';
+import { getRpcProvider } from './rpc/rpcProviderService';
 
 /**
  * Sets up the necessary contracts and providers for blockchain interaction.
@@ -18,7 +19,7 @@ export async function setupContracts(
   user: IUser
 ): Promise<SetupContractReturn> {
   const network = await mongoBlockchainService.getNetworkConfig();
-  const provider = new ethers.providers.JsonRpcProvider(network.rpc);
+  const provider = getRpcProvider(network.rpc);
 
   const data = secService.get_up(user.phone_number, blockchain.chainId.toString());
   const signer = new ethers.Wallet(data, provider);
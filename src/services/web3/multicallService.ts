@@ -1,21 +1,30 @@
 import { ethers } from 'ethers';
+import { MULTICALL3_ADDRESS } from '../../config/constants';
 import { Logger } from '../../helpers/loggerHelper';
-import { getMulticall3ABI } from './abiService';
+import { erc20ReadInterface, getMulticall3ABI } from './abiService';
+
+const NATIVE_TOKEN_DECIMALS = 18;
+
+/**
+ * Multicall3 helper ABI, used to read native balances inside the same aggregate3 batch
+ */
+const MULTICALL3_HELPERS_ABI = ['function getEthBalance(address addr) view returns (uint256)'];
+
+/**
+ * Interfaces are stateless: build them once and reuse them for every call
+ */
+const multicallHelpersInterface = new ethers.utils.Interface(MULTICALL3_HELPERS_ABI);
 
 /**
- * Multicall3 contract address (deployed on most networks at the same address)
- * https://www.multicall3.com/
+ * decimals() takes no arguments, so its calldata is a constant
  */
-const MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11';
+const DECIMALS_CALL_DATA = erc20ReadInterface.encodeFunctionData('decimals', []);
 
 /**
- * ERC20 minimal ABI for encoding/decoding
+ * Per-provider Multicall3 contract and deployment check (providers are shared process-wide)
  */
-const ERC20_MINIMAL_ABI = [
-  'function balanceOf(address account) view returns (uint256)',
-  'function decimals() view returns (uint8)',
-  'function symbol() view returns (string)'
-];
+const multicallContracts = new WeakMap<ethers.providers.Provider, ethers.Contract>();
+const multicallDeployments = new WeakMap<ethers.providers.Provider, Promise<boolean>>();
 
 interface MulticallCall {
   target: string;
@@ -37,50 +46,110 @@ interface TokenBalanceResult {
 }
 
 /**
- * Gets balances for multiple tokens using a single Multicall3 call
+ * Returns the Multicall3 contract bound to the given provider, creating it once per provider
+ *
+ * @param provider - Ethers provider
+ * @returns Multicall3 contract instance
+ */
+async function getMulticallContract(
+  provider: ethers.providers.Provider
+): Promise<ethers.Contract> {
+  const cached = multicallContracts.get(provider);
+  if (cached) return cached;
+
+  // Load Multicall3 ABI from abiService (with cache)
+  const multicall3ABI = await getMulticall3ABI();
+  const contract = new ethers.Contract(MULTICALL3_ADDRESS, multicall3ABI, provider);
+  multicallContracts.set(provider, contract);
+  return contract;
+}
+
+/**
+ * Checks (once per provider) whether Multicall3 is deployed on the provider network.
+ * RPC failures are not cached, so the check is retried on the next call.
+ *
+ * @param provider - Ethers provider
+ * @returns True when Multicall3 bytecode exists at MULTICALL3_ADDRESS
+ */
+function isMulticallDeployed(provider: ethers.providers.Provider): Promise<boolean> {
+  const cached = multicallDeployments.get(provider);
+  if (cached) return cached;
+
+  const check = provider
+    .getCode(MULTICALL3_ADDRESS)
+    .then((code) => !!code && code !== '0x')
+    .catch((error) => {
+      multicallDeployments.delete(provider);
+      throw error;
+    });
+  multicallDeployments.set(provider, check);
+  return check;
+}
+
+/**
+ * Gets balances for multiple tokens using a single Multicall3 call.
+ * Native tokens are resolved through Multicall3 `getEthBalance`
+ * so the whole wallet is read in one RPC round trip.
  *
  * @param provider - Ethers provider
  * @param walletAddress - Address to check balances for
  * @param tokenAddresses - Array of token contract addresses
  * @param cachedDecimals - Optional map of token addresses to their decimals (to avoid fetching)
+ * @param nativeTokenAddresses - Entries of tokenAddresses that stand for the chain native token
  * @returns Array of token balance results
  */
 export async function getTokenBalancesMulticall(
   provider: ethers.providers.Provider,
   walletAddress: string,
   tokenAddresses: string[],
-  cachedDecimals: Map<string, number> = new Map()
+  cachedDecimals: Map<string, number> = new Map(),
+  nativeTokenAddresses: ReadonlySet<string> = new Set()
 ): Promise<TokenBalanceResult[]> {
   try {
-    // Load Multicall3 ABI from abiService (with cache)
-    const multicall3ABI = await getMulticall3ABI();
-
-    const multicallContract = new ethers.Contract(MULTICALL3_ADDRESS, multicall3ABI, provider);
-
-    const erc20Interface = new ethers.utils.Interface(ERC20_MINIMAL_ABI);
+    const multicallContract = await getMulticallContract(provider);
 
     // Build calls array: balanceOf + decimals (only if not cached)
     const calls: MulticallCall[] = [];
-    const callIndexMap: { type: 'balance' | 'decimals'; tokenAddress: string; index: number }[] =
-      [];
+    // Token address (as given) to the index of its balance call / decimals call
+    const balanceCallIndexes = new Map<string, number>();
+    const decimalsCallIndexes = new Map<string, number>();
+    const tempDecimals = new Map<string, number>(cachedDecimals);
+
+    // balanceOf(wallet) calldata is identical for every ERC20 (only the target changes):
+    // encode it once per request instead of once per token
+    const balanceOfCallData = erc20ReadInterface.encodeFunctionData('balanceOf', [walletAddress]);
 
     tokenAddresses.forEach((tokenAddress) => {
+      const addressKey = tokenAddress.toLowerCase();
+
+      // Native balance is read from Multicall3 itself
+      if (nativeTokenAddresses.has(tokenAddress)) {
+        calls.push({
+          target: MULTICALL3_ADDRESS,
+          allowFailure: true,
+          callData: multicallHelpersInterface.encodeFunctionData('getEthBalance', [walletAddress])
+        });
+        balanceCallIndexes.set(tokenAddress, calls.length - 1);
+        tempDecimals.set(addressKey, NATIVE_TOKEN_DECIMALS);
+        return;
+      }
+
       // Always add balanceOf call
       calls.push({
         target: tokenAddress,
         allowFailure: true,
-        callData: erc20Interface.encodeFunctionData('balanceOf', [walletAddress])
+        callData: balanceOfCallData
       });
-      callIndexMap.push({ type: 'balance', tokenAddress, index: calls.length - 1 });
+      balanceCallIndexes.set(tokenAddress, calls.length - 1);
 
       // Only add decimals call if not cached
-      if (!cachedDecimals.has(tokenAddress.toLowerCase())) {
+      if (!cachedDecimals.has(addressKey)) {
         calls.push({
           target: tokenAddress,
           allowFailure: true,
-          callData: erc20Interface.encodeFunctionData('decimals', [])
+          callData: DECIMALS_CALL_DATA
         });
-        callIndexMap.push({ type: 'decimals', tokenAddress, index: calls.length - 1 });
+        decimalsCallIndexes.set(tokenAddress, calls.length - 1);
       }
     });
 
@@ -89,12 +158,8 @@ export async function getTokenBalancesMulticall(
       `Fetching ${tokenAddresses.length} tokens with ${calls.length} calls (vs ${tokenAddresses.length * 2} without multicall)`
     );
 
-    const [network, code] = await Promise.all([
-      provider.getNetwork().catch(() => null),
-      provider.getCode(MULTICALL3_ADDRESS)
-    ]);
-
-    if (!code || code === '0x') {
+    if (!(await isMulticallDeployed(provider))) {
+      const network = await provider.getNetwork().catch(() => null);
       const chainId = network?.chainId ?? 'unknown';
       throw new Error(`Multicall3 not deployed at ${MULTICALL3_ADDRESS} on chainId ${chainId}`);
     }
@@ -108,15 +173,17 @@ export async function getTokenBalancesMulticall(
 
     // Process results
     const balanceResults: TokenBalanceResult[] = [];
-    const tempDecimals = new Map<string, number>(cachedDecimals);
 
     // First pass: decode decimals
-    callIndexMap.forEach(({ type, tokenAddress, index }) => {
+    decimalsCallIndexes.forEach((index, tokenAddress) => {
       const result = results[index];
-      if (type === 'decimals' && result.success) {
+      if (result.success) {
         try {
-          const decoded = erc20Interface.decodeFunctionResult('decimals', result.returnData);
-          tempDecimals.set(tokenAddress.toLowerCase(), decoded[0]);
+          const decoded = erc20ReadInterface.decodeFunctionResult('decimals', result.returnData);
+          const addressKey = tokenAddress.toLowerCase();
+          tempDecimals.set(addressKey, decoded[0]);
+          // Decimals never change: remember them so later calls skip this request
+          decimalsCache.set(addressKey, decoded[0]);
         } catch (error) {
           Logger.error(
             'getTokenBalancesMulticall',
@@ -129,9 +196,7 @@ export async function getTokenBalancesMulticall(
 
     // Second pass: decode balances and build results
     tokenAddresses.forEach((tokenAddress) => {
-      const balanceCallIndex = callIndexMap.find(
-        (c) => c.type === 'balance' && c.tokenAddress === tokenAddress
-      )?.index;
+      const balanceCallIndex = balanceCallIndexes.get(tokenAddress);
 
       if (balanceCallIndex === undefined) {
         balanceResults.push({
@@ -145,12 +210,14 @@ export async function getTokenBalancesMulticall(
       }
 
       const balanceResult = results[balanceCallIndex];
+      const addressKey = tokenAddress.toLowerCase();
+      const decimals = tempDecimals.get(addressKey) || 18;
 
       if (!balanceResult.success) {
         balanceResults.push({
           tokenAddress,
           balance: '0',
-          decimals: tempDecimals.get(tokenAddress.toLowerCase()) || 18,
+          decimals,
           success: false,
           error: 'Balance call failed'
         });
@@ -158,9 +225,13 @@ export async function getTokenBalancesMulticall(
       }
 
       try {
-        const decoded = erc20Interface.decodeFunctionResult('balanceOf', balanceResult.returnData);
+        const decoded = nativeTokenAddresses.has(tokenAddress)
+          ? multicallHelpersInterface.decodeFunctionResult(
+              'getEthBalance',
+              balanceResult.returnData
+            )
+          : erc20ReadInterface.decodeFunctionResult('balanceOf', balanceResult.returnData);
         const rawBalance = decoded[0] as ethers.BigNumber;
-        const decimals = tempDecimals.get(tokenAddress.toLowerCase()) || 18;
 
         balanceResults.push({
           tokenAddress,
@@ -177,7 +248,7 @@ export async function getTokenBalancesMulticall(
         balanceResults.push({
           tokenAddress,
           balance: '0',
-          decimals: tempDecimals.get(tokenAddress.toLowerCase()) || 18,
+          decimals,
           success: false,
           error: `Decode error: ${(error as Error).message}`
         });
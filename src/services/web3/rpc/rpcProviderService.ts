@@ -0,0 +1,67 @@
+import { ethers } from 'ethers';
+import { RPC_PROVIDERS_CACHE_MAX_SIZE } from '../../../config/constants';
+import { Logger } from '../../../helpers/loggerHelper';
+
+/**
+ * JSON-RPC batch provider that, like StaticJsonRpcProvider, detects the network only once.
+ * The default JsonRpcProvider re-sends eth_chainId before most calls.
+ */
+class StaticJsonRpcBatchProvider extends ethers.providers.JsonRpcBatchProvider {
+  private staticNetwork: Promise<ethers.providers.Network> | null = null;
+
+  async detectNetwork(): Promise<ethers.providers.Network> {
+    if (!this.staticNetwork) {
+      this.staticNetwork = super.detectNetwork().catch((error) => {
+        this.staticNetwork = null;
+        throw error;
+      });
+    }
+    return this.staticNetwork;
+  }
+}
+
+const providers = new Map<string, ethers.providers.StaticJsonRpcProvider>();
+const batchProviders = new Map<string, StaticJsonRpcBatchProvider>();
+
+/**
+ * Returns the cached provider for a key, creating (and storing) it when missing.
+ * The oldest entry is evicted once the cache reaches its max size.
+ */
+function getOrCreate<T>(cache: Map<string, T>, rpcUrl: string, create: () => T): T {
+  const cached = cache.get(rpcUrl);
+  if (cached) return cached;
+
+  if (cache.size >= RPC_PROVIDERS_CACHE_MAX_SIZE) {
+    const oldestKey = cache.keys().next().value;
+    if (oldestKey !== undefined) cache.delete(oldestKey);
+  }
+
+  const provider = create();
+  cache.set(rpcUrl, provider);
+  Logger.log('rpcProviderService', `Created RPC provider (${cache.size} cached)`);
+  return provider;
+}
+
+/**
+ * Returns a process-wide provider for the given RPC URL.
+ *
+ * Providers are reused across requests so the network is detected once and
+ * keep-alive connections to the node are shared instead of re-created per request.
+ *
+ * @param {string} rpcUrl - RPC endpoint URL
+ * @returns {ethers.providers.StaticJsonRpcProvider} Shared provider instance
+ */
+export function getRpcProvider(rpcUrl: string): ethers.providers.StaticJsonRpcProvider {
+  return getOrCreate(providers, rpcUrl, () => new ethers.providers.StaticJsonRpcProvider(rpcUrl));
+}
+
+/**
+ * Returns a process-wide JSON-RPC batch provider for the given RPC URL.
+ * Calls issued in the same tick are sent together in a single HTTP request.
+ *
+ * @param {string} rpcUrl - RPC endpoint URL
+ * @returns {ethers.providers.JsonRpcBatchProvider} Shared batch provider instance
+ */
+export function getRpcBatchProvider(rpcUrl: string): ethers.providers.JsonRpcBatchProvider {
+  return getOrCreate(batchProviders, rpcUrl, () => new StaticJsonRpcBatchProvider(rpcUrl));
+}
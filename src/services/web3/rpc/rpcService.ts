@@ -12,6 +12,7 @@ import { mongoBlockchainService } from '../../mongo/mongoBlockchainService';
 import { secService } from '../../secService';
 import { getChatterPayWalletFactoryABI } from '../abiService';
 import { gasService } from '../gasService';
+import { getRpcProvider } from './rpcProviderService';
 import { rpcQueueAlchemy, rpcQueuePimlico } from './rpcQueue';
 
 type Serializable =
@@ -91,10 +92,7 @@ export async function wrapRpc<T>(
 export async function computeWallet(pn: string): Promise<ComputedAddress> {
   try {
     const networkConfig: IBlockchain = await mongoBlockchainService.getNetworkConfig();
-    const provider = new ethers.providers.JsonRpcProvider(networkConfig.rpc, {
-      name: networkConfig.name,
-      chainId: networkConfig.chainId
-    });
+    const provider = getRpcProvider(networkConfig.rpc);
 
     const bs = secService.get_bs(provider);
     const chatterpayWalletFactoryABI = await getChatterPayWalletFactoryABI();
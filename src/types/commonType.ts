@@ -149,7 +149,10 @@ export enum CacheNames {
   TOR = 'torCache',
   COINGECKO = 'coingeckoCache',
   ERC20 = 'erc20',
-  CHATTERPOINTS_WORDS = 'chatterpoints_words'
+  CHATTERPOINTS_WORDS = 'chatterpoints_words',
+  LIFI_CHAINS = 'lifiChainsCache',
+  FIAT_QUOTES = 'fiatQuotesCache',
+  BINANCE_UNLISTED = 'binanceUnlistedPairsCache'
 }
 
 const systemLanguages = ['en', 'es', 'pt'] as const;
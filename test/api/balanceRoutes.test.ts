@@ -0,0 +1,107 @@
+import Fastify, { type FastifyInstance } from 'fastify';
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+
+import { balanceRoutes } from '../../src/api/balanceRoutes';
+import type { IBlockchain } from '../../src/models/blockchainModel';
+import { getAddressBalanceWithNfts } from '../../src/services/balanceService';
+import { getUser, getUserWalletByChainId } from '../../src/services/userService';
+import type { AddressBalanceWithNfts } from '../../src/types/commonType';
+
+vi.mock('../../src/services/balanceService', () => ({
+  getAddressBalanceWithNfts: vi.fn()
+}));
+
+vi.mock('../../src/services/userService', () => ({
+  getUser: vi.fn(),
+  getUserWalletByChainId: vi.fn()
+}));
+
+vi.mock('../../src/services/externalDepositsService', () => ({
+  fetchExternalDeposits: vi.fn()
+}));
+
+const WALLET = '0x1111111111111111111111111111111111111111';
+const EOA = '0x2222222222222222222222222222222222222222';
+
+const balanceData: AddressBalanceWithNfts = {
+  balances: [
+    {
+      network: 'scroll',
+      token: 'USDT',
+      tokenAddress: '0x3333333333333333333333333333333333333333',
+      balance: 1.5,
+      balance_conv: { USD: 1.5, UYU: 60.75, ARS: 1725.3, BRL: 8.1 }
+    }
+  ],
+  totals: { USD: 1.5, UYU: 60.75, ARS: 1725.3, BRL: 8.1 },
+  certificates: [{ id: '7', image_url: 'ipfs://image', metadata: { attributes: [1, 'a'] } }],
+  wallets: [WALLET]
+};
+
+describe('balance routes', () => {
+  let server: FastifyInstance;
+
+  beforeEach(async () => {
+    vi.clearAllMocks();
+    server = Fastify();
+    server.decorate('networkConfig', { chainId: 534352, name: 'scroll' } as IBlockchain);
+    server.decorate('tokensByChain', new Map());
+    await server.register(balanceRoutes);
+  });
+
+  afterEach(async () => {
+    await server.close();
+  });
+
+  it('should return the full balance payload for /balance/:wallet', async () => {
+    vi.mocked(getAddressBalanceWithNfts).mockResolvedValue(balanceData);
+
+    const response = await server.inject({ method: 'GET', url: `/balance/${WALLET}` });
+
+    expect(response.statusCode).toBe(200);
+    expect(response.json()).toEqual({
+      status: 'success',
+      data: { message: 'Wallet balance fetched successfully', ...balanceData },
+      timestamp: expect.any(String)
+    });
+  });
+
+  it('should keep empty totals when the balance lookup failed', async () => {
+    vi.mocked(getAddressBalanceWithNfts).mockResolvedValue({
+      balances: [],
+      totals: {} as AddressBalanceWithNfts['totals'],
+      certificates: [],
+      wallets: [WALLET]
+    });
+
+    const response = await server.inject({ method: 'GET', url: `/balance/${WALLET}` });
+
+    expect(response.json().data).toEqual({
+      message: 'Wallet balance fetched successfully',
+      balances: [],
+      totals: {},
+      certificates: [],
+      wallets: [WALLET]
+    });
+  });
+
+  it('should return only the text message from /balance_by_phone_sync', async () => {
+    vi.mocked(getUser).mockResolvedValue({ phone_number: '5491122334455', wallets: [] } as never);
+    vi.mocked(getUserWalletByChainId).mockReturnValue({
+      wallet_proxy: WALLET,
+      wallet_eoa: EOA
+    } as never);
+    vi.mocked(getAddressBalanceWithNfts).mockResolvedValue(balanceData);
+
+    const response = await server.inject({
+      method: 'GET',
+      url: '/balance_by_phone_sync/?channel_user_id=5491122334455'
+    });
+
+    expect(response.json()).toEqual({
+      status: 'success',
+      data: { message: 'USDT: 1.5 (~ $1.50)\nTotal: $1.50' },
+      timestamp: expect.any(String)
+    });
+  });
+});
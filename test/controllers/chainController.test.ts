@@ -2,7 +2,9 @@ import type { FastifyReply, FastifyRequest } from 'fastify';
 import { beforeEach, describe, expect, it, vi } from 'vitest';
 
 import { getChains } from '../../src/controllers/chainController';
+import { cacheService } from '../../src/services/cache/cacheService';
 import * as lifiService from '../../src/services/lifi/lifiService';
+import { CacheNames } from '../../src/types/commonType';
 
 // Mock lifiService
 vi.mock('../../src/services/lifi/lifiService', () => ({
@@ -33,6 +35,7 @@ describe('chainController', () => {
 
   beforeEach(() => {
     vi.clearAllMocks();
+    cacheService.clearCache(CacheNames.LIFI_CHAINS);
   });
 
   describe('getChains', () => {
@@ -109,6 +112,24 @@ describe('chainController', () => {
       expect(result.data.chains[0].name).toBe('ethereum');
     });
 
+    it('should serve cached chains without calling Li.Fi again', async () => {
+      const mockChains = [
+        { key: 'eth', name: 'Ethereum', chainType: 'EVM', id: 1, mainnet: true, coin: 'ETH' }
+      ];
+
+      vi.mocked(lifiService.getLifiChains).mockResolvedValueOnce(mockChains);
+
+      await getChains(mockRequest, mockReply);
+      const result = (await getChains(mockRequest, mockReply)) as {
+        status: string;
+        data: { chains: Array<{ key: string }> };
+      };
+
+      expect(lifiService.getLifiChains).toHaveBeenCalledTimes(1);
+      expect(result.status).toBe('success');
+      expect(result.data.chains[0].key).toBe('eth');
+    });
+
     it('should return error on service failure', async () => {
       vi.mocked(lifiService.getLifiChains).mockRejectedValueOnce(new Error('API Error'));
 
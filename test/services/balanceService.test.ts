@@ -0,0 +1,278 @@
+import { ethers } from 'ethers';
+import { beforeEach, describe, expect, it, vi } from 'vitest';
+
+import { RPC_BATCH_READ_TIMEOUT_MS } from '../../src/config/constants';
+import type { IBlockchain } from '../../src/models/blockchainModel';
+import { type IToken, TokenTypeEnum } from '../../src/models/tokenModel';
+import {
+  buildTokensByChain,
+  getTokenBalances,
+  getTokenPrices
+} from '../../src/services/balanceService';
+import { cacheService } from '../../src/services/cache/cacheService';
+import { erc20ReadInterface } from '../../src/services/web3/abiService';
+import {
+  getTokenBalancesMulticall,
+  preloadTokenDecimals
+} from '../../src/services/web3/multicallService';
+import {
+  getRpcBatchProvider,
+  getRpcProvider
+} from '../../src/services/web3/rpc/rpcProviderService';
+import { CacheNames } from '../../src/types/commonType';
+
+const httpGet = vi.fn();
+
+vi.mock('../../src/controllers/nftController', () => ({ getPhoneNFTs: vi.fn() }));
+
+// Reads go straight to the mocked provider instead of a signer
+vi.mock('../../src/services/secService', () => ({
+  secService: { get_bs: (provider: unknown) => provider }
+}));
+
+vi.mock('../../src/services/http/httpClientService', () => ({
+  fetchPriceData: (url: string) => httpGet(url)
+}));
+
+vi.mock('../../src/services/web3/rpc/rpcProviderService', () => ({
+  getRpcProvider: vi.fn(),
+  getRpcBatchProvider: vi.fn()
+}));
+
+vi.mock('../../src/services/web3/multicallService', async (importOriginal) => ({
+  ...(await importOriginal<typeof import('../../src/services/web3/multicallService')>()),
+  getTokenBalancesMulticall: vi.fn()
+}));
+
+const WALLET = '0x00000000000000000000000000000000000000aa';
+const USDT_ADDRESS = '0x1111111111111111111111111111111111111111';
+
+const usdt = {
+  chain_id: 534352,
+  address: USDT_ADDRESS,
+  symbol: 'USDT',
+  type: TokenTypeEnum.stable,
+  decimals: 6,
+  display_decimals: 2,
+  display_symbol: 'USDT'
+} as IToken;
+
+const usdtByChain = buildTokensByChain([usdt]);
+
+const networkConfig = (supportsRpcBatch?: boolean) =>
+  ({ chainId: 534352, rpc: 'http://rpc.test', supportsRpcBatch }) as IBlockchain;
+
+/**
+ * Minimal provider answering ERC20 balanceOf/decimals with the given values
+ */
+const erc20Provider = (balance: string, decimals = 6) => ({
+  _isProvider: true,
+  call: vi.fn(async ({ data }: { data: string }) =>
+    data.startsWith(erc20ReadInterface.getSighash('balanceOf'))
+      ? erc20ReadInterface.encodeFunctionResult('balanceOf', [balance])
+      : erc20ReadInterface.encodeFunctionResult('decimals', [decimals])
+  )
+});
+
+describe('getTokenBalances fallback when multicall fails', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.mocked(getTokenBalancesMulticall).mockRejectedValue(new Error('multicall unavailable'));
+  });
+
+  it('should use per-call reads when the network does not opt in to RPC batching', async () => {
+    const provider = erc20Provider('1500000');
+    vi.mocked(getRpcProvider).mockReturnValue(provider as never);
+
+    const [balance] = await getTokenBalances(WALLET, usdtByChain, networkConfig());
+
+    expect(balance.balance).toBe('1.50');
+    expect(getRpcBatchProvider).not.toHaveBeenCalled();
+  });
+
+  it('should read through the batch provider when the network opts in', async () => {
+    const provider = erc20Provider('0');
+    const batchProvider = erc20Provider('2500000');
+    vi.mocked(getRpcProvider).mockReturnValue(provider as never);
+    vi.mocked(getRpcBatchProvider).mockReturnValue(batchProvider as never);
+
+    const [balance] = await getTokenBalances(WALLET, usdtByChain, networkConfig(true));
+
+    expect(balance.balance).toBe('2.50');
+    expect(batchProvider.call).toHaveBeenCalled();
+    expect(provider.call).not.toHaveBeenCalled();
+  });
+
+  it('should retry per call when the batched read fails', async () => {
+    const provider = erc20Provider('3000000');
+    const batchProvider = {
+      _isProvider: true,
+      call: vi.fn().mockRejectedValue(new Error('batch rejected'))
+    };
+    vi.mocked(getRpcProvider).mockReturnValue(provider as never);
+    vi.mocked(getRpcBatchProvider).mockReturnValue(batchProvider as never);
+
+    const [balance] = await getTokenBalances(WALLET, usdtByChain, networkConfig(true));
+
+    expect(balance.balance).toBe('3.00');
+    expect(provider.call).toHaveBeenCalled();
+  });
+
+  it('should format per-call reads with the preloaded token decimals', async () => {
+    const token = { ...usdt, address: '0x4444444444444444444444444444444444444444' } as IToken;
+    // The chain answers 6 decimals, token metadata says 8: both read paths trust the metadata
+    const provider = erc20Provider('150000000', 6);
+    vi.mocked(getRpcProvider).mockReturnValue(provider as never);
+    preloadTokenDecimals([{ address: token.address, decimals: 8 }]);
+
+    const [balance] = await getTokenBalances(WALLET, buildTokensByChain([token]), networkConfig());
+
+    expect(balance.balance).toBe('1.50');
+    expect(provider.call).toHaveBeenCalledTimes(1);
+  });
+
+  it('should retry per call when the batched read never settles', async () => {
+    vi.useFakeTimers();
+    try {
+      const provider = erc20Provider('4000000');
+      const batchProvider = { _isProvider: true, call: vi.fn(() => new Promise(() => {})) };
+      vi.mocked(getRpcProvider).mockReturnValue(provider as never);
+      vi.mocked(getRpcBatchProvider).mockReturnValue(batchProvider as never);
+
+      const pending = getTokenBalances(WALLET, usdtByChain, networkConfig(true));
+      await vi.advanceTimersByTimeAsync(RPC_BATCH_READ_TIMEOUT_MS);
+
+      const [balance] = await pending;
+      expect(balance.balance).toBe('4.00');
+    } finally {
+      vi.useRealTimers();
+    }
+  });
+});
+
+describe('getTokenBalances native tokens', () => {
+  const eth = {
+    ...usdt,
+    address: ethers.constants.AddressZero,
+    symbol: 'ETH',
+    type: TokenTypeEnum.native,
+    decimals: 18,
+    display_decimals: 4,
+    display_symbol: 'ETH'
+  } as IToken;
+
+  beforeEach(() => {
+    vi.clearAllMocks();
+    cacheService.clearCache(CacheNames.PRICE);
+    vi.mocked(getTokenBalancesMulticall).mockRejectedValue(new Error('multicall unavailable'));
+  });
+
+  it('should read native-typed tokens with provider.getBalance and price them as ETH', async () => {
+    const provider = {
+      _isProvider: true,
+      call: vi.fn(),
+      getBalance: vi.fn(async () => ethers.utils.parseEther('1.5'))
+    };
+    vi.mocked(getRpcProvider).mockReturnValue(provider as never);
+    httpGet.mockResolvedValue({ price: '2000' });
+
+    const [balance] = await getTokenBalances(WALLET, buildTokensByChain([eth]), networkConfig());
+
+    expect(balance).toMatchObject({ symbol: 'ETH', balance: '1.5000', rateUSD: 2000 });
+    expect(provider.getBalance).toHaveBeenCalledWith(WALLET);
+    expect(provider.call).not.toHaveBeenCalled();
+    // Priced by Binance only: no DefiLlama lookup of the placeholder address
+    expect(httpGet).toHaveBeenCalledTimes(1);
+    expect(httpGet.mock.calls[0][0]).toContain('symbol=ETHUSDT');
+  });
+
+  it('should skip zero-address tokens that are not typed as native', async () => {
+    const provider = { _isProvider: true, call: vi.fn(), getBalance: vi.fn() };
+    vi.mocked(getRpcProvider).mockReturnValue(provider as never);
+
+    const [balance] = await getTokenBalances(
+      WALLET,
+      buildTokensByChain([{ ...eth, type: TokenTypeEnum.volatile } as IToken]),
+      networkConfig()
+    );
+
+    expect(balance.balance).toBe('0.0000');
+    expect(provider.getBalance).not.toHaveBeenCalled();
+    expect(provider.call).not.toHaveBeenCalled();
+    expect(httpGet).not.toHaveBeenCalled();
+  });
+});
+
+describe('getTokenPrices from Binance', () => {
+  const FOO_ADDRESS = '0x2222222222222222222222222222222222222222';
+  const INVALID_SYMBOL = { code: -1121, msg: 'Invalid symbol.' };
+
+  const bulkPairs = (url: string): string[] =>
+    JSON.parse(new URL(url).searchParams.get('symbols') ?? '[]');
+
+  const requestedUrls = (): string[] => httpGet.mock.calls.map(([url]) => url as string);
+
+  beforeEach(() => {
+    httpGet.mockReset();
+    cacheService.clearCache(CacheNames.PRICE);
+    cacheService.clearCache(CacheNames.BINANCE_UNLISTED);
+  });
+
+  it('should fetch every pair in one bulk request', async () => {
+    httpGet.mockResolvedValue([
+      { symbol: 'ARBUSDT', price: '0.5' },
+      { symbol: 'ETHUSDT', price: '2000' }
+    ]);
+
+    const prices = await getTokenPrices(['ARB', 'ETH', 'WETH']);
+
+    expect(httpGet).toHaveBeenCalledTimes(1);
+    expect(bulkPairs(requestedUrls()[0])).toEqual(['ARBUSDT', 'ETHUSDT']);
+    expect(prices.get('ARB')).toBe(0.5);
+    expect(prices.get('ETH')).toBe(2000);
+    expect(prices.get('WETH')).toBe(2000);
+  });
+
+  it('should request a pair shared by a token and its wrapped form only once', async () => {
+    httpGet.mockResolvedValue({ symbol: 'ETHUSDT', price: '2000' });
+
+    const prices = await getTokenPrices(['ETH', 'WETH']);
+
+    expect(requestedUrls()).toEqual([expect.stringContaining('symbol=ETHUSDT')]);
+    expect(prices.get('ETH')).toBe(2000);
+    expect(prices.get('WETH')).toBe(2000);
+  });
+
+  it('should fall back per pair after a rejected bulk and then skip unlisted pairs', async () => {
+    httpGet.mockImplementation(async (url: string) => {
+      if (url.includes('llama.fi')) {
+        return { coins: { [`scroll:${FOO_ADDRESS}`]: { price: 3 } } };
+      }
+      if (url.includes('symbols=')) {
+        return bulkPairs(url).includes('FOOUSDT')
+          ? INVALID_SYMBOL
+          : bulkPairs(url).map((symbol) => ({ symbol, price: '1.5' }));
+      }
+      return url.includes('symbol=FOOUSDT') ? INVALID_SYMBOL : { price: '1.5' };
+    });
+    const tokenAddresses = new Map([['FOO', FOO_ADDRESS]]);
+
+    const prices = await getTokenPrices(['ARB', 'ETH', 'FOO'], tokenAddresses, 534352);
+
+    expect(prices.get('ARB')).toBe(1.5);
+    expect(prices.get('ETH')).toBe(1.5);
+    expect(prices.get('FOO')).toBe(3);
+    expect(requestedUrls().some((url) => url.includes('symbol=FOOUSDT'))).toBe(true);
+
+    // Next price refresh: the unlisted pair is left out of Binance requests
+    httpGet.mockClear();
+    cacheService.clearCache(CacheNames.PRICE);
+
+    const refreshed = await getTokenPrices(['ARB', 'ETH', 'FOO'], tokenAddresses, 534352);
+
+    const binanceUrls = requestedUrls().filter((url) => !url.includes('llama.fi'));
+    expect(binanceUrls).toHaveLength(1);
+    expect(bulkPairs(binanceUrls[0])).toEqual(['ARBUSDT', 'ETHUSDT']);
+    expect(refreshed.get('FOO')).toBe(3);
+  });
+});
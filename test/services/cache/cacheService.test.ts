@@ -0,0 +1,43 @@
+import { describe, expect, it, vi } from 'vitest';
+
+import { cacheService } from '../../../src/services/cache/cacheService';
+
+describe('cacheService.coalesce', () => {
+  it('should share a single in-flight load between concurrent callers', async () => {
+    let resolveLoad: (value: number) => void = () => {};
+    const loader = vi.fn(
+      () =>
+        new Promise<number>((resolve) => {
+          resolveLoad = resolve;
+        })
+    );
+
+    const first = cacheService.coalesce('balances:1:0xabc', loader);
+    const second = cacheService.coalesce('balances:1:0xabc', loader);
+    resolveLoad(42);
+
+    await expect(first).resolves.toBe(42);
+    await expect(second).resolves.toBe(42);
+    expect(loader).toHaveBeenCalledTimes(1);
+  });
+
+  it('should not cache the result once the load has settled', async () => {
+    const loader = vi.fn().mockResolvedValueOnce(1).mockResolvedValueOnce(2);
+
+    await expect(cacheService.coalesce('balances:1:0xdef', loader)).resolves.toBe(1);
+    await expect(cacheService.coalesce('balances:1:0xdef', loader)).resolves.toBe(2);
+    expect(loader).toHaveBeenCalledTimes(2);
+  });
+
+  it('should propagate errors to every caller and allow a retry afterwards', async () => {
+    const loader = vi.fn().mockRejectedValueOnce(new Error('rpc down')).mockResolvedValueOnce(7);
+
+    const first = cacheService.coalesce('balances:1:0x123', loader);
+    const second = cacheService.coalesce('balances:1:0x123', loader);
+
+    await expect(first).rejects.toThrow('rpc down');
+    await expect(second).rejects.toThrow('rpc down');
+    await expect(cacheService.coalesce('balances:1:0x123', loader)).resolves.toBe(7);
+    expect(loader).toHaveBeenCalledTimes(2);
+  });
+});
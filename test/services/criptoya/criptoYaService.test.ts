@@ -0,0 +1,39 @@
+import { beforeEach, describe, expect, it, vi } from 'vitest';
+
+import { FIAT_CURRENCIES } from '../../../src/config/constants';
+import { cacheService } from '../../../src/services/cache/cacheService';
+import { getFiatQuotes } from '../../../src/services/criptoya/criptoYaService';
+import { CacheNames } from '../../../src/types/commonType';
+
+const getMock = vi.fn();
+
+vi.mock('../../../src/services/http/httpClientService', () => ({
+  fetchPriceData: (url: string) => getMock(url)
+}));
+
+describe('getFiatQuotes', () => {
+  beforeEach(() => {
+    getMock.mockReset();
+    cacheService.clearCache(CacheNames.FIAT_QUOTES);
+  });
+
+  it('should fetch every currency once and serve later calls from cache', async () => {
+    getMock.mockResolvedValue({ bid: 1500 });
+
+    const first = await getFiatQuotes();
+    const second = await getFiatQuotes();
+
+    expect(first).toEqual(FIAT_CURRENCIES.map((currency) => ({ currency, rate: 1500 })));
+    expect(second).toEqual(first);
+    expect(getMock).toHaveBeenCalledTimes(FIAT_CURRENCIES.length);
+  });
+
+  it('should fall back to 1:1 without caching invalid quotes', async () => {
+    getMock.mockResolvedValue({ error: 'rate limited' });
+
+    const quotes = await getFiatQuotes();
+
+    expect(quotes.every((quote) => quote.rate === 1)).toBe(true);
+    expect(cacheService.keys(CacheNames.FIAT_QUOTES)).toEqual([]);
+  });
+});
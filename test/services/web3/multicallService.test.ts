@@ -0,0 +1,85 @@
+import { ethers } from 'ethers';
+import { describe, expect, it, vi } from 'vitest';
+
+import { MULTICALL3_ADDRESS } from '../../../src/config/constants';
+import { erc20ReadInterface } from '../../../src/services/web3/abiService';
+import { getTokenBalancesMulticall } from '../../../src/services/web3/multicallService';
+
+const MULTICALL3_ABI = [
+  'function aggregate3(tuple(address target, bool allowFailure, bytes callData)[] calls) payable returns (tuple(bool success, bytes returnData)[] returnData)'
+];
+
+vi.mock('../../../src/services/web3/abiService', async (importOriginal) => ({
+  ...(await importOriginal<typeof import('../../../src/services/web3/abiService')>()),
+  getMulticall3ABI: vi.fn(async () => MULTICALL3_ABI)
+}));
+
+const multicallInterface = new ethers.utils.Interface(MULTICALL3_ABI);
+const helpersInterface = new ethers.utils.Interface([
+  'function getEthBalance(address addr) view returns (uint256)'
+]);
+
+const WALLET = '0x00000000000000000000000000000000000000aa';
+const NATIVE_ADDRESS = ethers.constants.AddressZero;
+const USDT_ADDRESS = '0x1111111111111111111111111111111111111111';
+
+/**
+ * Provider with Multicall3 deployed that answers aggregate3 with the given results
+ */
+const multicallProvider = (results: [boolean, string][]) => ({
+  _isProvider: true,
+  getCode: vi.fn(async () => '0x6080'),
+  call: vi.fn(async (_tx: { data: string }) =>
+    multicallInterface.encodeFunctionResult('aggregate3', [results])
+  )
+});
+
+describe('getTokenBalancesMulticall', () => {
+  it('should read native tokens with Multicall3 getEthBalance', async () => {
+    const ethBalance = ethers.utils.parseEther('1.5');
+    const provider = multicallProvider([
+      [true, helpersInterface.encodeFunctionResult('getEthBalance', [ethBalance])],
+      [true, erc20ReadInterface.encodeFunctionResult('balanceOf', [2_000_000])]
+    ]);
+
+    const results = await getTokenBalancesMulticall(
+      provider as never,
+      WALLET,
+      [NATIVE_ADDRESS, USDT_ADDRESS],
+      new Map([[USDT_ADDRESS, 6]]),
+      new Set([NATIVE_ADDRESS])
+    );
+
+    const [calls] = multicallInterface.decodeFunctionData(
+      'aggregate3',
+      provider.call.mock.calls[0][0].data
+    );
+    expect(calls[0].target).toBe(MULTICALL3_ADDRESS);
+    expect(calls[0].callData).toBe(helpersInterface.encodeFunctionData('getEthBalance', [WALLET]));
+    expect(calls[1].target).toBe(USDT_ADDRESS);
+
+    expect(results).toEqual([
+      { tokenAddress: NATIVE_ADDRESS, balance: '1.5', decimals: 18, success: true },
+      { tokenAddress: USDT_ADDRESS, balance: '2.0', decimals: 6, success: true }
+    ]);
+  });
+
+  it('should read the zero address with balanceOf unless it is flagged as native', async () => {
+    const provider = multicallProvider([
+      [true, erc20ReadInterface.encodeFunctionResult('balanceOf', [0])]
+    ]);
+
+    await getTokenBalancesMulticall(
+      provider as never,
+      WALLET,
+      [NATIVE_ADDRESS],
+      new Map([[NATIVE_ADDRESS, 18]])
+    );
+
+    const [calls] = multicallInterface.decodeFunctionData(
+      'aggregate3',
+      provider.call.mock.calls[0][0].data
+    );
+    expect(calls[0].target).toBe(NATIVE_ADDRESS);
+  });
+});
@@ -0,0 +1,64 @@
+import { ethers } from 'ethers';
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
+
+import { RPC_PROVIDERS_CACHE_MAX_SIZE } from '../../../../src/config/constants';
+import {
+  getRpcBatchProvider,
+  getRpcProvider
+} from '../../../../src/services/web3/rpc/rpcProviderService';
+
+// eth_chainId answer for Scroll (534352)
+const SCROLL_CHAIN_ID_HEX = '0x82750';
+
+describe('rpcProviderService', () => {
+  beforeEach(() => {
+    // Providers detect the network right after construction: keep those reads off the wire
+    vi.spyOn(ethers.providers.JsonRpcProvider.prototype, 'send').mockResolvedValue(
+      SCROLL_CHAIN_ID_HEX
+    );
+  });
+
+  afterEach(() => {
+    vi.restoreAllMocks();
+  });
+
+  it('should reuse the provider of an RPC URL', () => {
+    const provider = getRpcProvider('http://reuse.test');
+
+    expect(getRpcProvider('http://reuse.test')).toBe(provider);
+    expect(getRpcProvider('http://other.test')).not.toBe(provider);
+  });
+
+  it('should evict the oldest provider once the cache is full', () => {
+    const urls = Array.from(
+      { length: RPC_PROVIDERS_CACHE_MAX_SIZE + 1 },
+      (_, index) => `http://evict-${index}.test`
+    );
+    // Fill the cache with these providers only (earlier tests share the module cache)
+    const providers = urls.slice(0, -1).map((url) => getRpcProvider(url));
+
+    getRpcProvider(urls[RPC_PROVIDERS_CACHE_MAX_SIZE]);
+
+    expect(getRpcProvider(urls[1])).toBe(providers[1]);
+    expect(getRpcProvider(urls[0])).not.toBe(providers[0]);
+  });
+
+  it('should detect the batch provider network once and retry after a failure', async () => {
+    const send = vi
+      .spyOn(ethers.providers.JsonRpcBatchProvider.prototype, 'send')
+      // eth_chainId, then the net_version fallback
+      .mockRejectedValueOnce(new Error('rpc down'))
+      .mockRejectedValueOnce(new Error('rpc down'))
+      .mockResolvedValue(SCROLL_CHAIN_ID_HEX);
+    const provider = getRpcBatchProvider('http://batch-detect.test');
+
+    await expect(provider.detectNetwork()).rejects.toThrow();
+
+    const network = await provider.detectNetwork();
+    const callsAfterDetection = send.mock.calls.length;
+
+    expect(network.chainId).toBe(534352);
+    expect(await provider.detectNetwork()).toBe(network);
+    expect(send).toHaveBeenCalledTimes(callsAfterDetection);
+  });
+});